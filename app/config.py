@@ -4,7 +4,7 @@ Loads settings from environment variables with validation.
 """
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import field_validator, model_validator, ValidationError
+from pydantic import field_validator, model_validator, ValidationError, ValidationInfo
 from typing import Optional
 import re
 import sys
@@ -58,6 +58,9 @@ class Settings(BaseSettings):
 
     ssh_timeout: int = 60
     ssh_connection_timeout: int = 10
+    ssh_idle_timeout: int = 600  # Close cached SSH connections unused this long (0 = never)
+    ssh_keepalive_interval: int = 30  # Seconds between SSH keepalive requests (0 = off)
+    ssh_keepalive_count_max: int = 3  # Unanswered keepalives before a connection is closed
 
     # Discord Webhook
     discord_webhook_url: str
@@ -110,6 +113,9 @@ class Settings(BaseSettings):
     cert_expiry_warning_days: int = 30  # Warn if cert expires in <30 days
     memory_leak_threshold_mb_per_hour: float = 5.0  # Memory growth rate threshold
 
+    # Phase 4: Runbooks
+    runbook_cache_dir: str = "/app/cache"  # Writable dir for the parsed-runbook cache (empty = off)
+
     # Phase 5: Self-preservation settings
     # External URL for n8n to callback to Jarvis (must be reachable from n8n host)
     # Defaults to ssh_skynet_host:port but should be set explicitly in production
@@ -212,6 +218,23 @@ class Settings(BaseSettings):
             )
         return v
 
+    @field_validator('ssh_skynet_host', 'ssh_skynet_user')
+    @classmethod
+    def validate_skynet_ssh_target(cls, v: str, info: ValidationInfo) -> str:
+        """
+        Require the Skynet SSH host/user used by self-restart handoffs.
+
+        n8n SSHes here to run restart commands, and the host is the fallback
+        for the callback URL - fail at startup rather than on every restart.
+        """
+        v = v.strip()
+        if not v:
+            raise ValueError(
+                f"{info.field_name} must not be empty. "
+                "Self-restart handoffs need it to reach Skynet."
+            )
+        return v
+
     @field_validator('n8n_url')
     @classmethod
     def validate_n8n_url(cls, v: str) -> str:
@@ -5,6 +5,7 @@ Handles remediation log tracking, maintenance windows, and command whitelist.
 
 import asyncio
 import asyncpg
+import orjson
 import structlog
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
@@ -70,6 +71,11 @@ def retry_with_backoff(max_retries=10, base_delay=1, max_delay=30):
     return decorator
 
 
+def _jsonb_encode(value: Any) -> str:
+    """Encode a value for a JSONB parameter (text format expects str)."""
+    return orjson.dumps(value).decode()
+
+
 class Database:
     """PostgreSQL database interface."""
 
@@ -102,9 +108,27 @@ class Database:
             min_size=1,
             max_size=settings.database_pool_size,
             command_timeout=30,
+            init=self._init_connection,
         )
         self.logger.info("database_connected", pool_size=settings.database_pool_size)
 
+    @staticmethod
+    async def _init_connection(conn: asyncpg.Connection):
+        """
+        Per-connection setup for pooled connections.
+
+        Registers a JSONB codec so dicts/lists are passed to and returned from
+        JSONB columns directly, without callers encoding/decoding by hand.
+        Uses orjson, which is several times faster than stdlib json on the
+        large docker inspect payloads stored in state snapshots.
+        """
+        await conn.set_type_codec(
+            'jsonb',
+            encoder=_jsonb_encode,
+            decoder=orjson.loads,
+            schema='pg_catalog'
+        )
+
     async def disconnect(self):
         """Close database connection pool."""
         if self.pool:
@@ -4,6 +4,7 @@ Sends formatted alerts about successful/failed remediations and escalations.
 """
 
 import aiohttp
+import orjson
 import structlog
 from typing import List, Optional
 from datetime import datetime
@@ -18,6 +19,11 @@ MAX_EMBED_FIELD_LENGTH = 1000
 MAX_TRUNCATED_INDICATOR = "... (truncated)"
 
 
+def _json_dumps(payload) -> str:
+    """Serialize webhook payloads with orjson (aiohttp expects a str)."""
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class DiscordNotifier:
     """Sends notifications to Discord via webhook."""
 
@@ -32,7 +38,7 @@ class DiscordNotifier:
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create the HTTP session for connection pooling."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            self._session = aiohttp.ClientSession(json_serialize=_json_dumps)
         return self._session
 
     async def close(self):
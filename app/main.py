@@ -176,6 +176,7 @@ async def lifespan(app: FastAPI):
 
     # Phase 3: Initialize rollback manager for state snapshots
     rollback_mgr = init_rollback_manager(ssh_executor=ssh_executor)
+    await rollback_mgr.start()
     logger.info("rollback_manager_initialized")
 
     # Phase 3: Initialize and start proactive monitoring
@@ -199,7 +200,10 @@ async def lifespan(app: FastAPI):
     if not os.path.exists(runbook_dir):
         # Fallback for local development
         runbook_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "runbooks")
-    init_runbook_manager(runbook_dir=runbook_dir)
+    init_runbook_manager(
+        runbook_dir=runbook_dir,
+        cache_dir=settings.runbook_cache_dir or None
+    )
     logger.info("runbook_manager_initialized", runbook_dir=runbook_dir)
 
     # Phase 4: Initialize Prometheus metrics
@@ -221,7 +225,7 @@ async def lifespan(app: FastAPI):
     # Check JARVIS_EXTERNAL_URL is configured (warn if using fallback)
     if not settings.jarvis_external_url:
         phase5_warnings.append(
-            f"JARVIS_EXTERNAL_URL not set - using fallback based on ssh_management-host_host. "
+            f"JARVIS_EXTERNAL_URL not set - using fallback based on ssh_skynet_host. "
             f"Set explicitly for reliable n8n callbacks."
         )
 
@@ -290,6 +294,9 @@ async def lifespan(app: FastAPI):
     # Phase 3: Stop proactive monitoring
     if proactive_mon:
         await proactive_mon.stop()
+    # Phase 3: Flush pending state snapshots before the pool closes
+    await rollback_mgr.stop()
+    await prometheus_client.close()
     # HIGH-011 FIX: Close SSH connections on shutdown to prevent resource leaks
     await ssh_executor.close_all_connections()
     await db.disconnect()
@@ -2619,5 +2626,6 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
-        log_level=settings.log_level.lower()
+        log_level=settings.log_level.lower(),
+        loop="auto"  # uvloop when installed (not on Windows), else asyncio
     )
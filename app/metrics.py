@@ -28,6 +28,12 @@ pattern_matches = Counter(
     ['result']  # hit, miss
 )
 
+hint_cache_lookups = Counter(
+    'jarvis_hint_cache_lookups_total',
+    'Alert hint extraction cache lookups (hit = reused, miss = extracted)',
+    ['result']  # hit, miss
+)
+
 api_calls = Counter(
     'jarvis_claude_api_calls_total',
     'Claude API calls by model and result',
@@ -210,6 +216,11 @@ def record_pattern_match(hit: bool):
     pattern_matches.labels(result='hit' if hit else 'miss').inc()
 
 
+def record_hint_cache_lookup(hit: bool):
+    """Record an alert hint extraction cache lookup."""
+    hint_cache_lookups.labels(result='hit' if hit else 'miss').inc()
+
+
 def record_api_call(model: str, status: str, duration_seconds: float = None):
     """
     Record a Claude API call.
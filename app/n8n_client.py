@@ -6,12 +6,16 @@ certificate renewal, system health checks, and more.
 
 import asyncio
 import httpx
+import orjson
 import structlog
 from typing import Optional, Dict, Any, List
 from .config import settings
 
 logger = structlog.get_logger()
 
+# Sent with pre-encoded (orjson) webhook bodies
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class N8NClient:
     """Trigger n8n workflows for complex remediation operations."""
@@ -371,9 +375,11 @@ class N8NClient:
 
             async with httpx.AsyncClient(timeout=60.0) as client:
                 if method.upper() == "POST":
+                    # orjson-encoded body (httpx's json= goes through stdlib json)
                     response = await client.post(
                         url,
-                        json=data or {}
+                        content=orjson.dumps(data or {}, option=orjson.OPT_NON_STR_KEYS),
+                        headers=_JSON_HEADERS
                     )
                 else:
                     response = await client.get(
@@ -7,6 +7,7 @@ by checking if alerts actually resolved after fix attempts.
 
 import httpx
 import asyncio
+import time
 import structlog
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timedelta
@@ -18,6 +19,8 @@ logger = structlog.get_logger()
 class PrometheusClient:
     """Query Prometheus for alert status and metrics."""
 
+    # Max age of the last good /api/v1/alerts response served during an outage
+    ALERTS_STALE_MAX_AGE = 60
     def __init__(self, base_url: Optional[str] = None):
         """
         Initialize Prometheus client.
@@ -31,6 +34,61 @@ class PrometheusClient:
         self.timeout = 10.0
         self.logger = logger.bind(component="prometheus_client")
 
+        # Last successful alerts response: (monotonic timestamp, alerts)
+        self._alerts_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+
+        # Shared client so concurrent verification/trend/prediction queries
+        # multiplex over one HTTP/2 connection instead of a TCP handshake each
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the shared HTTP client."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=2, keepalive_expiry=60)
+            )
+        return self._client
+
+    async def close(self):
+        """Close the shared HTTP client. Call on shutdown."""
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
+
+    async def _refresh_alerts(self) -> Tuple[List[Dict[str, Any]], float]:
+        """
+        Fetch active alerts, falling back to the last good response.
+
+        Returns:
+            Tuple of (alerts, age_seconds); age is 0 for a fresh response
+
+        Raises:
+            httpx.HTTPError: If Prometheus is unreachable and nothing is cached
+        """
+        try:
+            client = self._get_client()
+            response = await client.get(f"{self.base_url}/api/v1/alerts")
+            response.raise_for_status()
+            data = response.json()
+
+            alerts = data.get("data", {}).get("alerts", [])
+            self._alerts_cache = (time.monotonic(), alerts)
+            return alerts, 0.0
+
+        except httpx.HTTPError as e:
+            if self._alerts_cache is None:
+                raise
+
+            cached_at, alerts = self._alerts_cache
+            age = time.monotonic() - cached_at
+            self.logger.warning(
+                "prometheus_cache_serving_stale",
+                age_seconds=round(age, 1),
+                error=str(e)
+            )
+            return alerts, age
+
     async def get_alert_status(
         self,
         alert_name: str,
@@ -40,44 +98,20 @@ class PrometheusClient:
         """
         Check if an alert is currently firing.
 
+        If Prometheus is unreachable, answers from the last good response
+        while it is younger than ALERTS_STALE_MAX_AGE.
+
         Args:
             alert_name: Name of the alert to check
             instance: Optional instance label to filter by
             labels: Optional additional labels to match
 
         Returns:
-            "firing", "pending", or "resolved"
+            "firing", "pending", "resolved", or "unknown_stale" if Prometheus
+            is unreachable and the cached response is too old
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{self.base_url}/api/v1/alerts")
-                response.raise_for_status()
-                data = response.json()
-
-                for alert in data.get("data", {}).get("alerts", []):
-                    alert_labels = alert.get("labels", {})
-
-                    # Check alert name match
-                    if alert_labels.get("alertname") != alert_name:
-                        continue
-
-                    # Check instance match if specified
-                    if instance and alert_labels.get("instance") != instance:
-                        continue
-
-                    # Check additional labels if specified
-                    if labels:
-                        match = all(
-                            alert_labels.get(k) == v
-                            for k, v in labels.items()
-                        )
-                        if not match:
-                            continue
-
-                    return alert.get("state", "firing")
-
-                return "resolved"
-
+            alerts, age = await self._refresh_alerts()
         except httpx.HTTPError as e:
             self.logger.error(
                 "prometheus_alert_check_failed",
@@ -86,6 +120,23 @@ class PrometheusClient:
             )
             raise
 
+        if age > self.ALERTS_STALE_MAX_AGE:
+            return "unknown_stale"
+
+        # Build the required label set once; each alert is then matched with
+        # a single subset comparison of item views (done in C)
+        required = dict(labels) if labels else {}
+        required["alertname"] = alert_name
+        if instance:
+            required["instance"] = instance
+        required_items = required.items()
+
+        for alert in alerts:
+            if required_items <= alert.get("labels", {}).items():
+                return alert.get("state", "firing")
+
+        return "resolved"
+
     async def verify_remediation(
         self,
         alert_name: str,
@@ -98,6 +149,10 @@ class PrometheusClient:
         """
         Poll Prometheus to verify alert has resolved after remediation.
 
+        Polling stops at max_wait_seconds. Only fresh answers count as
+        verification checks; polls answered with stale data (Prometheus
+        outage) are retried within that time but never decide the result.
+
         Args:
             alert_name: Name of the alert to verify
             instance: Optional instance label to filter by
@@ -116,18 +171,41 @@ class PrometheusClient:
             max_wait=max_wait_seconds
         )
 
+        started = time.monotonic()
+        deadline = started + max_wait_seconds
+
         # Wait for fix to take effect
         await asyncio.sleep(initial_delay)
 
         checks = (max_wait_seconds - initial_delay) // poll_interval
         status = "unknown"
+        fresh_checks = 0
+        stale_checks = 0
+        polls = 0
 
-        for i in range(checks):
+        while fresh_checks < checks and time.monotonic() < deadline:
+            polls += 1
             try:
-                status = await self.get_alert_status(alert_name, instance, labels)
+                check_status = await self.get_alert_status(alert_name, instance, labels)
+
+                if check_status == "unknown_stale":
+                    # Prometheus outage - soft failure, keep the last real
+                    # status and don't count it as a check
+                    stale_checks += 1
+                    self.logger.info(
+                        "verification_check_stale",
+                        alert_name=alert_name,
+                        check_number=polls,
+                        stale_checks=stale_checks
+                    )
+                    await asyncio.sleep(poll_interval)
+                    continue
+
+                fresh_checks += 1
+                status = check_status
 
                 if status == "resolved":
-                    elapsed = initial_delay + ((i + 1) * poll_interval)
+                    elapsed = int(time.monotonic() - started)
                     self.logger.info(
                         "remediation_verified_success",
                         alert_name=alert_name,
@@ -139,15 +217,16 @@ class PrometheusClient:
                     "alert_still_active",
                     alert_name=alert_name,
                     status=status,
-                    check_number=i + 1
+                    check_number=polls
                 )
 
             except Exception as e:
+                fresh_checks += 1
                 self.logger.warning(
                     "verification_check_failed",
                     alert_name=alert_name,
                     error=str(e),
-                    check_number=i + 1
+                    check_number=polls
                 )
 
             await asyncio.sleep(poll_interval)
@@ -156,8 +235,12 @@ class PrometheusClient:
             "remediation_verification_failed",
             alert_name=alert_name,
             final_status=status,
-            max_wait=max_wait_seconds
+            max_wait=max_wait_seconds,
+            fresh_checks=fresh_checks,
+            stale_checks=stale_checks
         )
+        if not fresh_checks:
+            return False, f"Alert status unknown after {max_wait_seconds}s (Prometheus data stale)"
         return False, f"Alert still {status} after {max_wait_seconds}s"
 
     async def query_instant(self, query: str) -> List[Dict[str, Any]]:
@@ -171,23 +254,23 @@ class PrometheusClient:
             List of result dictionaries with metric and value
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/api/v1/query",
-                    params={"query": query}
+            client = self._get_client()
+            response = await client.get(
+                f"{self.base_url}/api/v1/query",
+                params={"query": query}
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            if data.get("status") != "success":
+                self.logger.error(
+                    "prometheus_query_error",
+                    query=query,
+                    error=data.get("error", "Unknown error")
                 )
-                response.raise_for_status()
-                data = response.json()
-
-                if data.get("status") != "success":
-                    self.logger.error(
-                        "prometheus_query_error",
-                        query=query,
-                        error=data.get("error", "Unknown error")
-                    )
-                    return []
+                return []
 
-                return data.get("data", {}).get("result", [])
+            return data.get("data", {}).get("result", [])
 
         except httpx.HTTPError as e:
             self.logger.error(
@@ -218,28 +301,28 @@ class PrometheusClient:
         start = end - timedelta(hours=hours)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/api/v1/query_range",
-                    params={
-                        "query": query,
-                        "start": start.isoformat(),
-                        "end": end.isoformat(),
-                        "step": step
-                    }
+            client = self._get_client()
+            response = await client.get(
+                f"{self.base_url}/api/v1/query_range",
+                params={
+                    "query": query,
+                    "start": start.isoformat(),
+                    "end": end.isoformat(),
+                    "step": step
+                }
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            if data.get("status") != "success":
+                self.logger.error(
+                    "prometheus_range_query_error",
+                    query=query,
+                    error=data.get("error", "Unknown error")
                 )
-                response.raise_for_status()
-                data = response.json()
-
-                if data.get("status") != "success":
-                    self.logger.error(
-                        "prometheus_range_query_error",
-                        query=query,
-                        error=data.get("error", "Unknown error")
-                    )
-                    return []
+                return []
 
-                return data.get("data", {}).get("result", [])
+            return data.get("data", {}).get("result", [])
 
         except httpx.HTTPError as e:
             self.logger.error(
@@ -306,13 +389,92 @@ class PrometheusClient:
         """
         Predict when a metric will hit a threshold.
 
-        Useful for disk/memory exhaustion prediction.
+        Useful for disk/memory exhaustion prediction. Prometheus computes the
+        slope server-side with deriv() (least-squares over 24h), returned
+        together with the current value in a single instant query, instead
+        of pulling ~288 range samples per series and fitting in Python.
 
         Args:
             metric: Prometheus metric name (e.g., node_filesystem_avail_bytes)
             instance: Target instance
             threshold: Value to predict reaching (default 0)
 
+        Returns:
+            Prediction dictionary with hours_remaining
+        """
+        selector = f'{metric}{{instance="{instance}"}}'
+        query = (
+            f'label_replace({selector}, "jarvis_field", "current", "", "")'
+            f' or label_replace(deriv({selector}[24h]), "jarvis_field", "deriv", "", "")'
+        )
+
+        results = await self.query_instant(query)
+
+        # Pair current value and slope per series (e.g. per filesystem)
+        series: Dict[Tuple, Dict[str, float]] = {}
+        for result in results:
+            labels = dict(result.get("metric", {}))
+            field = labels.pop("jarvis_field", None)
+            labels.pop("__name__", None)
+            try:
+                value = float(result["value"][1])
+            except (KeyError, IndexError, ValueError):
+                continue
+            series.setdefault(tuple(sorted(labels.items())), {})[field] = value
+
+        pairs = [
+            (fields["current"], fields["deriv"])
+            for fields in series.values()
+            if "current" in fields and "deriv" in fields
+        ]
+
+        if not pairs:
+            # No server-side result (e.g. too little history) - use range query path
+            return await self._predict_exhaustion_from_trend(metric, instance, threshold)
+
+        # Report the series that will exhaust soonest
+        exhausting = [
+            (current, per_second)
+            for current, per_second in pairs
+            if per_second < 0
+        ]
+
+        if not exhausting:
+            current, per_second = pairs[0]
+            return {
+                "prediction": "stable_or_improving",
+                "current": current,
+                "trend": per_second * 300  # Per 5-minute step, as before
+            }
+
+        current, per_second = min(
+            exhausting,
+            key=lambda pair: (pair[0] - threshold) / -pair[1]
+        )
+        hours_to_threshold = abs((current - threshold) / (per_second * 3600))
+
+        return {
+            "prediction": "will_exhaust",
+            "current": current,
+            "threshold": threshold,
+            "hours_remaining": round(hours_to_threshold, 1),
+            "trend_per_hour": per_second * 3600
+        }
+
+    async def _predict_exhaustion_from_trend(
+        self,
+        metric: str,
+        instance: str,
+        threshold: float = 0
+    ) -> Dict[str, Any]:
+        """
+        Predict threshold exhaustion from a 24h range query (fallback path).
+
+        Args:
+            metric: Prometheus metric name
+            instance: Target instance
+            threshold: Value to predict reaching
+
         Returns:
             Prediction dictionary with hours_remaining
         """
@@ -355,9 +517,9 @@ class PrometheusClient:
             True if healthy, False otherwise
         """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.base_url}/-/healthy")
-                return response.status_code == 200
+            client = self._get_client()
+            response = await client.get(f"{self.base_url}/-/healthy", timeout=5.0)
+            return response.status_code == 200
         except Exception:
             return False
 
@@ -3,7 +3,10 @@ State snapshot and rollback manager.
 Track state before remediation for potential rollback if things go wrong.
 """
 
-import json
+import asyncio
+import functools
+import orjson
+import secrets
 import structlog
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
@@ -11,6 +14,7 @@ from enum import Enum
 
 from .config import settings
 from .database import db
+from .models import HostType
 
 logger = structlog.get_logger()
 
@@ -23,11 +27,41 @@ class SnapshotType(str, Enum):
     DATABASE = "database"
 
 
+@functools.lru_cache(maxsize=16)
+def _to_host(host: str) -> HostType:
+    """Convert a host string to HostType (raises ValueError if unknown)."""
+    return HostType(host)
+
+
+def _new_snapshot_id() -> str:
+    """
+    Generate a unique snapshot ID.
+
+    Seconds-resolution timestamps alone collide when several snapshots are
+    captured in the same second (alert storms), violating the UNIQUE
+    constraint. The random suffix keeps IDs unique while the prefix keeps
+    them roughly time-sortable.
+    """
+    return f"snap-{int(datetime.now().timestamp())}-{secrets.token_hex(4)}"
+
+
 class RollbackManager:
     """Track state before remediation for potential rollback."""
 
     # Snapshot retention period
     RETENTION_HOURS = 24
+    CLEANUP_INTERVAL = 3600    # Seconds between background retention sweeps
+    CLEANUP_BATCH_SIZE = 1000  # Rows deleted per statement (bounds lock time/WAL burst)
+
+    # Kept as a single constant so asyncpg's per-connection statement cache
+    # parses and plans it once, then reuses the prepared statement.
+    # created_at stays server-side so ordering/age queries use the DB clock.
+    INSERT_SNAPSHOT_SQL = """
+        INSERT INTO state_snapshots (
+            snapshot_id, host, target_type, target_name,
+            state_data, alert_context, created_at
+        ) VALUES ($1, $2, $3, $4, $5, $6, NOW())
+    """
 
     def __init__(self, ssh_executor=None):
         """
@@ -39,6 +73,170 @@ class RollbackManager:
         self.ssh_executor = ssh_executor
         self.logger = logger.bind(component="rollback_manager")
 
+        # Pending (row, written future) pairs, written by the background flusher
+        self._pending: asyncio.Queue = asyncio.Queue()
+        self._flush_requested = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._cleanup_task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Start background snapshot flush and retention cleanup tasks."""
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+        self.logger.info("snapshot_flusher_started")
+
+    async def stop(self):
+        """Stop background tasks and write any pending snapshots."""
+        for task in (self._cleanup_task, self._flush_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._cleanup_task = None
+        self._flush_task = None
+
+        await self.flush()
+        self.logger.info("snapshot_flusher_stopped")
+
+    async def _cleanup_loop(self):
+        """Periodically delete snapshots past the retention period."""
+        while True:
+            await self.cleanup_old_snapshots()
+            await asyncio.sleep(self.CLEANUP_INTERVAL)
+
+    async def _flush_loop(self):
+        """
+        Write pending snapshots as soon as they are queued.
+
+        Snapshots queued while a flush is running (alert storms) are
+        written together by the next one, in a single executemany batch.
+        """
+        while True:
+            await self._flush_requested.wait()
+            self._flush_requested.clear()
+            await self.flush()
+
+    async def _store_snapshot(self, row: tuple):
+        """
+        Queue a snapshot row for insertion and wait until it is written.
+
+        The flusher is woken right away, so a lone snapshot is written
+        immediately; snapshots queued while a flush is running share the
+        next batch. The caller only gets a snapshot_id back once the row is
+        in the database. Falls back to an immediate write when the flusher is not running
+        (e.g. before start() or after stop()).
+
+        Args:
+            row: Values matching INSERT_SNAPSHOT_SQL placeholders
+
+        Raises:
+            Exception: The insert error if the row could not be written
+        """
+        written = asyncio.get_running_loop().create_future()
+        self._pending.put_nowait((row, written))
+
+        if self._flush_task is None:
+            await self.flush()
+        else:
+            self._flush_requested.set()
+
+        await written
+
+    async def flush(self) -> int:
+        """
+        Write all pending snapshots in a single executemany batch.
+
+        executemany is atomic, so if the batch fails each row is retried on
+        its own; only rows that still fail are reported back to their
+        callers. Rows not yet written when the flush is cancelled go back
+        on the queue for the next flush.
+
+        Returns:
+            Number of snapshots written
+        """
+        async with self._flush_lock:
+            entries = []
+            while not self._pending.empty():
+                entries.append(self._pending.get_nowait())
+
+            if not entries:
+                return 0
+
+            rows = [row for row, _ in entries]
+            errors: List[Optional[Exception]] = []
+
+            try:
+                async with db.pool.acquire() as conn:
+                    try:
+                        await conn.executemany(self.INSERT_SNAPSHOT_SQL, rows)
+                        errors = [None] * len(rows)
+                    except Exception as e:
+                        self.logger.warning(
+                            "snapshot_batch_failed_retrying_rows",
+                            count=len(rows),
+                            error=str(e)
+                        )
+                        for row in rows:
+                            try:
+                                await conn.execute(self.INSERT_SNAPSHOT_SQL, *row)
+                                errors.append(None)
+                            except Exception as row_error:
+                                errors.append(row_error)
+
+            except asyncio.CancelledError:
+                for entry in entries[len(errors):]:
+                    self._pending.put_nowait(entry)
+                entries = entries[:len(errors)]
+                raise
+
+            except Exception as e:
+                # Pool/connection failure - nothing from this batch was written
+                errors = [e] * len(rows)
+
+            finally:
+                written = self._resolve_entries(entries, errors)
+
+            return written
+
+    def _resolve_entries(self, entries: list, errors: list) -> int:
+        """
+        Complete the futures of flushed entries with their insert outcome.
+
+        Args:
+            entries: (row, future) pairs taken off the queue
+            errors: Per-entry insert error, or None if written
+
+        Returns:
+            Number of snapshots written
+        """
+        written = 0
+        failed_ids = []
+
+        for (row, future), error in zip(entries, errors):
+            if error is None:
+                written += 1
+                if not future.done():
+                    future.set_result(None)
+            else:
+                failed_ids.append(row[0])
+                if not future.done():
+                    future.set_exception(error)
+
+        if failed_ids:
+            self.logger.error(
+                "snapshot_flush_failed",
+                count=len(failed_ids),
+                snapshot_ids=failed_ids,
+                error=str(next(e for e in errors if e is not None))
+            )
+        elif written:
+            self.logger.debug("snapshots_flushed", count=written)
+
+        return written
+
     async def snapshot_container_state(
         self,
         host: str,
@@ -67,23 +265,24 @@ class RollbackManager:
         )
 
         try:
-            from .models import HostType
-            host_enum = HostType(host)
-
-            # Capture current state
-            inspect_result = await self.ssh_executor.execute_commands(
-                host=host_enum,
-                commands=[f"docker inspect {container}"],
-                timeout=30
-            )
-
-            logs_result = await self.ssh_executor.execute_commands(
-                host=host_enum,
-                commands=[f"docker logs --tail 100 {container} 2>&1"],
-                timeout=30
+            host_enum = _to_host(host)
+
+            # Capture current state - inspect and logs are independent, so
+            # run them concurrently as separate channels on the host connection
+            inspect_result, logs_result = await asyncio.gather(
+                self.ssh_executor.execute_commands(
+                    host=host_enum,
+                    commands=[f"docker inspect {container}"],
+                    timeout=30
+                ),
+                self.ssh_executor.execute_commands(
+                    host=host_enum,
+                    commands=[f"docker logs --tail 100 {container} 2>&1"],
+                    timeout=30
+                )
             )
 
-            snapshot_id = f"snap-{datetime.now().timestamp():.0f}"
+            snapshot_id = _new_snapshot_id()
 
             state_data = {
                 "inspect": inspect_result.outputs[0] if inspect_result.outputs else "",
@@ -95,21 +294,15 @@ class RollbackManager:
                 }
             }
 
-            # Store in database
-            await db.execute(
-                """
-                INSERT INTO state_snapshots (
-                    snapshot_id, host, target_type, target_name,
-                    state_data, alert_context, created_at
-                ) VALUES ($1, $2, $3, $4, $5, $6, NOW())
-                """,
+            # Batched insert; snapshot_id is already known client-side
+            await self._store_snapshot((
                 snapshot_id,
                 host,
                 SnapshotType.CONTAINER.value,
                 container,
-                json.dumps(state_data),
+                state_data,
                 alert_context
-            )
+            ))
 
             self.logger.info(
                 "container_snapshot_captured",
@@ -156,24 +349,23 @@ class RollbackManager:
         )
 
         try:
-            from .models import HostType
-            host_enum = HostType(host)
-
-            # Capture service status
-            status_result = await self.ssh_executor.execute_commands(
-                host=host_enum,
-                commands=[f"systemctl status {service} --no-pager"],
-                timeout=30
-            )
-
-            # Capture service config if accessible
-            show_result = await self.ssh_executor.execute_commands(
-                host=host_enum,
-                commands=[f"systemctl show {service}"],
-                timeout=30
+            host_enum = _to_host(host)
+
+            # Capture service status and config (if accessible) concurrently
+            status_result, show_result = await asyncio.gather(
+                self.ssh_executor.execute_commands(
+                    host=host_enum,
+                    commands=[f"systemctl status {service} --no-pager"],
+                    timeout=30
+                ),
+                self.ssh_executor.execute_commands(
+                    host=host_enum,
+                    commands=[f"systemctl show {service}"],
+                    timeout=30
+                )
             )
 
-            snapshot_id = f"snap-{datetime.now().timestamp():.0f}"
+            snapshot_id = _new_snapshot_id()
 
             state_data = {
                 "status": status_result.outputs[0] if status_result.outputs else "",
@@ -181,20 +373,14 @@ class RollbackManager:
                 "captured_at": datetime.now().isoformat()
             }
 
-            await db.execute(
-                """
-                INSERT INTO state_snapshots (
-                    snapshot_id, host, target_type, target_name,
-                    state_data, alert_context, created_at
-                ) VALUES ($1, $2, $3, $4, $5, $6, NOW())
-                """,
+            await self._store_snapshot((
                 snapshot_id,
                 host,
                 SnapshotType.SERVICE.value,
                 service,
-                json.dumps(state_data),
+                state_data,
                 alert_context
-            )
+            ))
 
             self.logger.info(
                 "service_snapshot_captured",
@@ -225,15 +411,19 @@ class RollbackManager:
             Snapshot data or None if not found
         """
         try:
-            row = await db.fetchrow(
-                """
-                SELECT snapshot_id, host, target_type, target_name,
-                       state_data, alert_context, created_at, rolled_back_at
-                FROM state_snapshots
-                WHERE snapshot_id = $1
-                """,
-                snapshot_id
-            )
+            # Make sure a just-captured snapshot is visible before reading it
+            await self.flush()
+
+            async with db.pool.acquire() as conn:
+                row = await conn.fetchrow(
+                    """
+                    SELECT snapshot_id, host, target_type, target_name,
+                           state_data, alert_context, created_at, rolled_back_at
+                    FROM state_snapshots
+                    WHERE snapshot_id = $1
+                    """,
+                    snapshot_id
+                )
 
             if row:
                 return {
@@ -241,7 +431,7 @@ class RollbackManager:
                     "host": row["host"],
                     "target_type": row["target_type"],
                     "target_name": row["target_name"],
-                    "state_data": json.loads(row["state_data"]) if row["state_data"] else {},
+                    "state_data": row["state_data"] or {},
                     "alert_context": row["alert_context"],
                     "created_at": row["created_at"].isoformat() if row["created_at"] else None,
                     "rolled_back_at": row["rolled_back_at"].isoformat() if row["rolled_back_at"] else None
@@ -298,8 +488,7 @@ class RollbackManager:
         )
 
         try:
-            from .models import HostType
-            host_enum = HostType(host)
+            host_enum = _to_host(host)
 
             # For containers, restart is the primary rollback mechanism
             # This clears any corrupted state and returns to image defaults
@@ -312,16 +501,17 @@ class RollbackManager:
             success = result.success
 
             # Mark snapshot as rolled back
-            await db.execute(
-                """
-                UPDATE state_snapshots
-                SET rolled_back_at = NOW(),
-                    rollback_reason = $1
-                WHERE snapshot_id = $2
-                """,
-                reason,
-                snapshot_id
-            )
+            async with db.pool.acquire() as conn:
+                await conn.execute(
+                    """
+                    UPDATE state_snapshots
+                    SET rolled_back_at = NOW(),
+                        rollback_reason = $1
+                    WHERE snapshot_id = $2
+                    """,
+                    reason,
+                    snapshot_id
+                )
 
             self.logger.info(
                 "rollback_complete",
@@ -363,76 +553,112 @@ class RollbackManager:
         Returns:
             List of snapshot summaries
         """
+        # Bind hours as a parameter so the statement text is constant and
+        # asyncpg reuses one prepared plan regardless of the window size
         try:
-            if target_type:
-                rows = await db.fetch(
-                    """
-                    SELECT snapshot_id, host, target_type, target_name,
-                           alert_context, created_at, rolled_back_at
-                    FROM state_snapshots
-                    WHERE created_at > NOW() - INTERVAL '%s hours'
-                      AND target_type = $2
-                    ORDER BY created_at DESC
-                    LIMIT 100
-                    """,
-                    hours,
-                    target_type
-                )
-            else:
-                rows = await db.fetch(
-                    """
-                    SELECT snapshot_id, host, target_type, target_name,
-                           alert_context, created_at, rolled_back_at
-                    FROM state_snapshots
-                    WHERE created_at > NOW() - INTERVAL '%s hours'
-                    ORDER BY created_at DESC
-                    LIMIT 100
-                    """,
-                    hours
-                )
-
-            return [
-                {
-                    "snapshot_id": row["snapshot_id"],
-                    "host": row["host"],
-                    "target_type": row["target_type"],
-                    "target_name": row["target_name"],
-                    "alert_context": row["alert_context"],
-                    "created_at": row["created_at"].isoformat() if row["created_at"] else None,
-                    "rolled_back": row["rolled_back_at"] is not None
-                }
-                for row in rows
-            ]
+            async with db.pool.acquire() as conn:
+                if target_type:
+                    rows = await conn.fetch(
+                        """
+                        SELECT snapshot_id, host, target_type, target_name,
+                               alert_context, created_at,
+                           rolled_back_at IS NOT NULL AS rolled_back
+                        FROM state_snapshots
+                        WHERE created_at > NOW() - INTERVAL '1 hour' * $1
+                          AND target_type = $2
+                        ORDER BY created_at DESC
+                        LIMIT 100
+                        """,
+                        hours,
+                        target_type
+                    )
+                else:
+                    rows = await conn.fetch(
+                        """
+                        SELECT snapshot_id, host, target_type, target_name,
+                               alert_context, created_at,
+                           rolled_back_at IS NOT NULL AS rolled_back
+                        FROM state_snapshots
+                        WHERE created_at > NOW() - INTERVAL '1 hour' * $1
+                        ORDER BY created_at DESC
+                        LIMIT 100
+                        """,
+                        hours
+                    )
+
+            # Columns already match the summary keys; only created_at needs formatting
+            snapshots = []
+            for row in rows:
+                snapshot = dict(row)
+                created_at = snapshot["created_at"]
+                snapshot["created_at"] = created_at.isoformat() if created_at else None
+                snapshots.append(snapshot)
+
+            return snapshots
 
         except Exception as e:
             self.logger.error("list_snapshots_failed", error=str(e))
             return []
 
-    async def cleanup_old_snapshots(self, retention_hours: int = None):
+    async def cleanup_old_snapshots(self, retention_hours: int = None) -> int:
         """
         Delete snapshots older than retention period.
 
+        Deletes in CLEANUP_BATCH_SIZE chunks so a large backlog does not hold
+        row locks or produce one big WAL burst in a single statement.
+
         Args:
             retention_hours: Hours to retain (default: RETENTION_HOURS)
+
+        Returns:
+            Number of snapshots deleted
         """
         hours = retention_hours or self.RETENTION_HOURS
+        total_deleted = 0
 
         try:
-            result = await db.execute(
-                """
-                DELETE FROM state_snapshots
-                WHERE created_at < NOW() - INTERVAL '%s hours'
-                """,
-                hours
-            )
+            while True:
+                async with db.pool.acquire() as conn:
+                    result = await conn.execute(
+                        """
+                        DELETE FROM state_snapshots
+                        WHERE id IN (
+                            SELECT id FROM state_snapshots
+                            WHERE created_at < NOW() - INTERVAL '1 hour' * $1
+                            LIMIT $2
+                        )
+                        """,
+                        hours,
+                        self.CLEANUP_BATCH_SIZE
+                    )
+
+                deleted = int(result.split()[-1]) if result and result.split() else 0
+                total_deleted += deleted
+
+                if deleted:
+                    self.logger.debug("snapshot_cleanup_batch", deleted=deleted)
+
+                if deleted < self.CLEANUP_BATCH_SIZE:
+                    break
+
+                # Yield between batches so other queries get the pool/locks
+                await asyncio.sleep(0.1)
+
+            if total_deleted > 0:
+                self.logger.info(
+                    "old_snapshots_cleaned",
+                    deleted_count=total_deleted,
+                    retention_hours=hours
+                )
 
-            self.logger.info(
-                "old_snapshots_cleaned",
-                retention_hours=hours
+        except Exception as e:
+            self.logger.error(
+                "snapshot_cleanup_failed",
+                deleted_count=total_deleted,
+                error=str(e)
             )
 
-        except Exception as e:
-            self.logger.error("snapshot_cleanup_failed", error=str(e))
+        return total_deleted
 
     async def should_rollback(
         self,
@@ -466,7 +692,7 @@ class RollbackManager:
 
         # Parse the captured state
         try:
-            inspect_data = json.loads(state_data.get("inspect", "{}"))
+            inspect_data = orjson.loads(state_data.get("inspect") or "{}")
             if isinstance(inspect_data, list) and len(inspect_data) > 0:
                 inspect_data = inspect_data[0]
 
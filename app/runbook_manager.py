@@ -5,45 +5,206 @@ Phase 4: Loads runbooks from markdown files to provide Claude
 with structured remediation steps for specific alert types.
 """
 
+import io
 import os
 import re
+import sys
 import glob
+import functools
+import orjson
 import structlog
-from typing import Optional, Dict, List
+import ahocorasick
+from types import MappingProxyType
+from typing import Optional, Dict, List, Mapping, Sequence, Tuple
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
+from concurrent.futures import Future, ThreadPoolExecutor
 
 logger = structlog.get_logger()
 
+# Patterns compiled once at import instead of rebuilt on every parse.
+# Bytes patterns: runbooks are parsed as raw bytes and only the captured
+# fragments are decoded.
+_TITLE_RE = re.compile(rb'^#\s+(.+)$', re.MULTILINE)
+_LIST_ITEM_RE = re.compile(rb'^\s*[\d\.\-\*]+\s*(.+)$', re.MULTILINE)
 
-@dataclass
+# Fenced code blocks: ```, ```bash or ```sh at the end of a line opens one
+_FENCE = b'```'
+_FENCE_LANGS = (b'\n', b'bash\n', b'sh\n')
+
+
+def _opens_fence(line: bytes) -> bool:
+    """Whether a line ends with an opening ```/```bash/```sh fence."""
+    pos = line.rfind(_FENCE)
+    return pos != -1 and line[pos + len(_FENCE):] in _FENCE_LANGS
+
+
+def _section_header_re(section_name: str) -> re.Pattern:
+    """Compile a pattern locating a '## <section_name>' header line."""
+    return re.compile(
+        rb'^##\s+' + re.escape(section_name.encode()) + rb'\b',
+        re.MULTILINE | re.IGNORECASE
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _frontmatter_key_re(key: str) -> re.Pattern:
+    """Compiled pattern for a YAML frontmatter key."""
+    return re.compile(rb'^' + re.escape(key.encode()) + rb':\s*(.+)$', re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=32)
+def _inline_metadata_re(key: str) -> re.Pattern:
+    """Compiled pattern for an inline <!-- key: value --> comment."""
+    return re.compile(rb'<!--\s*' + re.escape(key.encode()) + rb':\s*(.+?)\s*-->')
+
+
+def _decode(data: bytes) -> str:
+    """Decode a captured runbook fragment."""
+    return data.decode('utf-8', errors='replace')
+
+
+@dataclass(slots=True, frozen=True)
 class Runbook:
-    """Structured runbook data."""
+    """
+    Structured runbook data.
+
+    Immutable once parsed (list fields are tuples), so instances are
+    hashable and safe to share between cache, index and callers. The
+    markdown source is not kept in memory; raw_content re-reads it from
+    source_path on demand.
+    """
     alert_name: str
     title: str
     overview: str
-    investigation_steps: List[str]
-    common_causes: List[str]
-    remediation_steps: List[str]
-    commands: List[str]
+    investigation_steps: Tuple[str, ...]
+    common_causes: Tuple[str, ...]
+    remediation_steps: Tuple[str, ...]
+    commands: Tuple[str, ...]
     risk_level: str
     estimated_duration: str
-    raw_content: str
+    source_path: Optional[str] = None
+    # Rendered get_runbook_context() output, built once at parse time
+    formatted_context: str = field(default="", repr=False, compare=False)
+
+    @property
+    def raw_content(self) -> Optional[str]:
+        """Original markdown, read from disk (None if unavailable)."""
+        if not self.source_path:
+            return None
+        try:
+            return Path(self.source_path).read_text(encoding='utf-8', errors='replace')
+        except OSError:
+            return None
 
 
 class RunbookManager:
     """Load and manage runbooks for remediation guidance."""
 
-    def __init__(self, runbook_dir: str = "/app/runbooks"):
+    # Section headers the parser extracts, compiled once
+    _SECTIONS = {
+        "overview": _section_header_re("Overview"),
+        "investigation": _section_header_re("Investigation"),
+        "common_causes": _section_header_re("Common Causes"),
+        "remediation": _section_header_re("Remediation"),
+    }
+
+    # Metadata keys read from frontmatter or inline comments, with defaults
+    _METADATA_DEFAULTS = {
+        "risk_level": "medium",
+        "estimated_duration": "5-10 minutes",
+    }
+
+    # Threads used to parse runbooks that miss the cache
+    PARSE_WORKERS = 8
+
+    # JSON cache of parsed runbooks, keyed per file by (mtime_ns, size).
+    # Kept in an app-owned directory: the runbook directory is mounted
+    # read-only, and JSON (unlike pickle) is safe to load from disk.
+    CACHE_FILENAME = "runbook_cache.json"
+    CACHE_VERSION = 6  # Bump when Runbook fields, parsing or context format change
+
+    def __init__(self, runbook_dir: str = "/app/runbooks", cache_dir: Optional[str] = None):
         """
         Initialize runbook manager.
 
         Args:
             runbook_dir: Directory containing runbook markdown files
+            cache_dir: Writable directory for the parsed-runbook cache
+                (None disables the cache)
         """
         self.runbook_dir = Path(runbook_dir)
-        self.runbooks: Dict[str, Runbook] = {}
+        # Read-only view, swapped wholesale on each (re)load
+        self.runbooks: Mapping[str, Runbook] = MappingProxyType({})
         self.logger = logger.bind(component="runbook_manager")
+        self._cache_path = Path(cache_dir) / self.CACHE_FILENAME if cache_dir else None
+
+        # Partial-match lookup index, rebuilt after each load
+        self._load_order: Dict[str, int] = {}
+        self._substring_index: Dict[str, str] = {}
+        self._key_automaton: Optional[ahocorasick.Automaton] = None
+
+        # list_runbooks() output, rebuilt after each load
+        self._summary_cache: List[Dict] = []
+
+    def _load_cache(self) -> Dict[str, tuple]:
+        """
+        Load the parsed-runbook cache.
+
+        Returns:
+            Dict of filename -> ((mtime_ns, size), Runbook or None); empty if
+            the cache is disabled, missing, unreadable, from another
+            CACHE_VERSION or for another runbook directory
+        """
+        if self._cache_path is None:
+            return {}
+        try:
+            cached = orjson.loads(self._cache_path.read_bytes())
+            if (
+                cached.get("version") != self.CACHE_VERSION
+                or cached.get("runbook_dir") != str(self.runbook_dir)
+            ):
+                return {}
+            return {
+                name: (tuple(signature), self._runbook_from_cache(data))
+                for name, (signature, data) in cached["entries"].items()
+            }
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.debug("runbook_cache_unreadable", error=str(e))
+        return {}
+
+    @staticmethod
+    def _runbook_from_cache(data: Optional[dict]) -> Optional[Runbook]:
+        """Rebuild a Runbook from its cached JSON object (lists -> tuples)."""
+        if data is None:
+            return None
+        return Runbook(**{
+            f.name: tuple(data[f.name]) if isinstance(data[f.name], list) else data[f.name]
+            for f in fields(Runbook)
+        })
+
+    def _save_cache(self, entries: Dict[str, tuple]):
+        """Write the parsed-runbook cache atomically (best effort)."""
+        if self._cache_path is None:
+            return
+        tmp_path = self._cache_path.with_suffix(".tmp")
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(orjson.dumps({
+                "version": self.CACHE_VERSION,
+                "runbook_dir": str(self.runbook_dir),
+                "entries": entries,
+            }))
+            os.replace(tmp_path, self._cache_path)
+        except Exception as e:
+            # Unwritable cache directory - we just re-parse next time
+            self.logger.warning("runbook_cache_write_failed", error=str(e))
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
 
     def load_runbooks(self) -> int:
         """
@@ -57,138 +218,305 @@ class RunbookManager:
                 "runbook_directory_not_found",
                 path=str(self.runbook_dir)
             )
+            self.runbooks = MappingProxyType({})
+            self._build_match_index()
+            self._summary_cache = []
             return 0
 
+        cache = self._load_cache()
+        entries = {}
+        runbooks: Dict[str, Runbook] = {}
+        parsed = 0
+
+        # DirEntry carries the file type from the directory read and caches
+        # its stat, so nothing here costs more than one syscall per file
+        with os.scandir(self.runbook_dir) as it:
+            md_files = [e for e in it if e.name.endswith(".md") and e.is_file()]
+
         loaded = 0
-        for filepath in self.runbook_dir.glob("*.md"):
-            try:
-                runbook = self._parse_runbook(filepath)
-                if runbook:
-                    self.runbooks[runbook.alert_name.lower()] = runbook
-                    loaded += 1
-                    self.logger.debug(
-                        "runbook_loaded",
-                        alert_name=runbook.alert_name,
-                        file=filepath.name
+        # Cache misses are parsed concurrently; results are collected here in
+        # directory order so runbooks is only written from this thread
+        # and load order (which breaks partial-match ties) is unchanged.
+        with ThreadPoolExecutor(max_workers=self.PARSE_WORKERS) as pool:
+            pending = []
+            for entry in md_files:
+                try:
+                    st = entry.stat()
+                except OSError as e:
+                    self.logger.error(
+                        "runbook_parse_failed",
+                        file=entry.name,
+                        error=str(e)
+                    )
+                    continue
+                signature = (st.st_mtime_ns, st.st_size)
+
+                cached = cache.get(entry.name)
+                if cached and cached[0] == signature:
+                    pending.append((entry.name, signature, cached[1]))
+                else:
+                    future = pool.submit(self._parse_runbook, Path(entry.path))
+                    pending.append((entry.name, signature, future))
+
+            for name, signature, result in pending:
+                try:
+                    if isinstance(result, Future):
+                        runbook = result.result()
+                        parsed += 1
+                    else:
+                        runbook = result
+                    entries[name] = (signature, runbook)
+
+                    if runbook:
+                        runbooks[sys.intern(runbook.alert_name.lower())] = runbook
+                        loaded += 1
+                        self.logger.debug(
+                            "runbook_loaded",
+                            alert_name=runbook.alert_name,
+                            file=name
+                        )
+                except Exception as e:
+                    self.logger.error(
+                        "runbook_parse_failed",
+                        file=name,
+                        error=str(e)
                     )
-            except Exception as e:
-                self.logger.error(
-                    "runbook_parse_failed",
-                    file=filepath.name,
-                    error=str(e)
-                )
+
+        # Only rewrite the cache when something was added, changed or removed
+        if parsed or entries.keys() != cache.keys():
+            self._save_cache(entries)
+
+        self.runbooks = MappingProxyType(runbooks)
+        self._build_match_index()
+        self._summary_cache = self._build_summary()
 
         self.logger.info(
             "runbooks_loaded",
             count=loaded,
+            parsed=parsed,
+            cached=len(entries) - parsed,
             directory=str(self.runbook_dir)
         )
 
         return loaded
 
+    def _build_match_index(self):
+        """
+        Index runbook keys for partial-match lookups in get_runbook.
+
+        Maps every substring of every runbook key to the earliest-loaded key
+        containing it (answers "alert name is part of a runbook key"), and
+        compiles the keys into an Aho-Corasick automaton so "runbook key is
+        part of the alert name" is one linear scan of the alert name.
+        """
+        self._load_order = {key: i for i, key in enumerate(self.runbooks)}
+
+        substring_index: Dict[str, str] = {}
+        for key in self.runbooks:
+            for start in range(len(key)):
+                for end in range(start + 1, len(key) + 1):
+                    substring_index.setdefault(key[start:end], key)
+
+        self._substring_index = substring_index
+
+        automaton = None
+        if self.runbooks:
+            automaton = ahocorasick.Automaton()
+            for key in self.runbooks:
+                automaton.add_word(key, key)
+            automaton.make_automaton()
+        self._key_automaton = automaton
+
     def _parse_runbook(self, filepath: Path) -> Optional[Runbook]:
         """
         Parse a runbook markdown file into structured data.
 
+        The file is read as bytes in one call (runbooks are a few KB, too
+        small for an mmap to pay off); the full text is never decoded or
+        kept, only the extracted fields (Runbook.raw_content reads it back
+        from disk if ever needed).
+
         Args:
             filepath: Path to markdown file
 
         Returns:
             Runbook object or None if parsing fails
         """
-        content = filepath.read_text()
+        content = filepath.read_bytes()
+        return self._parse_content(filepath.stem, content, str(filepath))
 
-        # Extract alert name from filename or h1 header
-        alert_name = filepath.stem  # Filename without extension
-
-        # Try to get title from first h1
-        title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-        title = title_match.group(1) if title_match else f"{alert_name} Runbook"
+    def _parse_content(
+        self,
+        alert_name: str,
+        content: bytes,
+        source_path: Optional[str] = None
+    ) -> Runbook:
+        """
+        Build a Runbook from raw markdown bytes in a single pass.
 
-        # Extract sections
-        overview = self._extract_section(content, "Overview", "Investigation")
-        investigation = self._extract_list_section(content, "Investigation")
-        causes = self._extract_list_section(content, "Common Causes")
-        remediation = self._extract_list_section(content, "Remediation")
-        commands = self._extract_code_blocks(content)
+        Every field is collected by one line-oriented scan: the title, the
+        section buffers, fenced code blocks, frontmatter and inline metadata.
+        List items and frontmatter keys are then picked out of the (much
+        smaller) buffers.
 
-        # Extract metadata from frontmatter if present
-        risk_level = self._extract_metadata(content, "risk_level", "medium")
-        estimated_duration = self._extract_metadata(content, "estimated_duration", "5-10 minutes")
+        Args:
+            alert_name: Alert name (runbook filename without extension)
+            content: Markdown content
+            source_path: File the content was read from
 
-        return Runbook(
+        Returns:
+            Runbook object
+        """
+        # Normalize CRLF/CR line endings (as text-mode reads did) so titles
+        # don't keep a trailing '\r' and '---\r\n' still opens frontmatter
+        if b'\r' in content:
+            content = content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+        headers = self._SECTIONS
+        title = None
+        sections: Dict[str, List[bytes]] = {}  # section -> body lines
+        open_sections = set()  # list sections still collecting
+        in_overview = False  # overview runs until the Investigation header
+        code: Optional[List[bytes]] = None  # open fenced block, if any
+        commands: List[str] = []
+        frontmatter: Optional[List[bytes]] = None
+        frontmatter_done = False
+        inline: Dict[str, str] = {}
+
+        for lineno, line in enumerate(self._iter_lines(content)):
+            # Title is the first h1 anywhere in the file
+            if title is None:
+                title_match = _TITLE_RE.match(line)
+                if title_match:
+                    title = _decode(title_match.group(1))
+
+            # Section bodies: a header opens its section (first occurrence
+            # only); list sections end at the next line starting with '##'
+            if line.startswith(b'##'):
+                open_sections.clear()
+                if in_overview:
+                    if headers["investigation"].match(line):
+                        in_overview = False
+                    else:
+                        sections["overview"].append(line)
+                for section, header_re in headers.items():
+                    if section not in sections and header_re.match(line):
+                        sections[section] = []
+                        if section == "overview":
+                            in_overview = True
+                        else:
+                            open_sections.add(section)
+            else:
+                for section in open_sections:
+                    sections[section].append(line)
+                if in_overview:
+                    sections["overview"].append(line)
+
+            # Fenced code blocks: ```, ```bash or ```sh opens, the next ```
+            # (anywhere on a line) closes
+            rest = line
+            while rest:
+                if code is None:
+                    if _opens_fence(rest):
+                        code = []
+                    break
+                close = rest.find(_FENCE)
+                if close == -1:
+                    code.append(rest)
+                    break
+                code.append(rest[:close])
+                self._collect_commands(code, commands)
+                code = None
+                rest = rest[close + len(_FENCE):]
+
+            # YAML frontmatter: '---' first line up to the next '---' line
+            if not frontmatter_done:
+                if lineno == 0:
+                    if line == b'---\n':
+                        frontmatter = []
+                    else:
+                        frontmatter_done = True
+                elif frontmatter and line.startswith(b'---'):
+                    frontmatter_done = True
+                else:
+                    frontmatter.append(line)
+
+            # Inline <!-- key: value --> metadata, first occurrence wins
+            if b'<!--' in line:
+                for key in self._METADATA_DEFAULTS:
+                    if key not in inline:
+                        inline_match = _inline_metadata_re(key).search(line)
+                        if inline_match:
+                            inline[key] = _decode(inline_match.group(1)).strip()
+
+        # An unterminated frontmatter block is not frontmatter
+        if not (frontmatter_done and frontmatter):
+            frontmatter = None
+
+        metadata = {
+            key: self._extract_metadata(frontmatter, inline, key, default)
+            for key, default in self._METADATA_DEFAULTS.items()
+        }
+
+        runbook = Runbook(
             alert_name=alert_name,
-            title=title,
-            overview=overview,
-            investigation_steps=investigation,
-            common_causes=causes,
-            remediation_steps=remediation,
-            commands=commands,
-            risk_level=risk_level,
-            estimated_duration=estimated_duration,
-            raw_content=content
+            title=title if title is not None else f"{alert_name} Runbook",
+            overview=_decode(b"".join(sections.get("overview", ()))).strip(),
+            investigation_steps=self._list_items(sections.get("investigation")),
+            common_causes=self._list_items(sections.get("common_causes")),
+            remediation_steps=self._list_items(sections.get("remediation")),
+            commands=tuple(commands),
+            risk_level=metadata["risk_level"],
+            estimated_duration=metadata["estimated_duration"],
+            source_path=source_path
         )
-
-    def _extract_section(
-        self,
-        content: str,
-        section_name: str,
-        next_section: str = None
+        # Frozen dataclass: the context is derived from the other fields, so
+        # it is attached after construction
+        object.__setattr__(runbook, "formatted_context", self._format_context(runbook))
+        return runbook
+
+    @staticmethod
+    def _iter_lines(content: bytes):
+        """Yield '\\n'-terminated lines (the last may be unterminated)."""
+        return iter(io.BytesIO(content).readline, b"")
+
+    @staticmethod
+    def _list_items(lines: Optional[List[bytes]]) -> Tuple[str, ...]:
+        """Extract numbered or bullet list items from a section body."""
+        if not lines:
+            return ()
+        body = b"".join(lines)
+        if not body.strip():
+            return ()
+
+        items = [_decode(item).strip() for item in _LIST_ITEM_RE.findall(body)]
+        return tuple(item for item in items if item)
+
+    @staticmethod
+    def _collect_commands(lines: List[bytes], commands: List[str]):
+        """Append the commands from a fenced code block's lines to commands."""
+        append = commands.append
+        for raw in lines:
+            line = _decode(raw).strip()
+            if line and line[0] != '#':
+                append(line)
+
+    @staticmethod
+    def _extract_metadata(
+        frontmatter: Optional[List[bytes]],
+        inline: Dict[str, str],
+        key: str,
+        default: str
     ) -> str:
-        """Extract content between section headers."""
-        pattern = rf'##\s+{section_name}.*?\n(.*?)'
-        if next_section:
-            pattern += rf'(?=##\s+{next_section}|$)'
-        else:
-            pattern += r'(?=##|$)'
-
-        match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
-        return ""
-
-    def _extract_list_section(self, content: str, section_name: str) -> List[str]:
-        """Extract bullet points from a section."""
-        section = self._extract_section(content, section_name)
-        if not section:
-            return []
-
-        # Match numbered or bullet list items
-        items = re.findall(r'^\s*[\d\.\-\*]+\s*(.+)$', section, re.MULTILINE)
-        return [item.strip() for item in items if item.strip()]
-
-    def _extract_code_blocks(self, content: str) -> List[str]:
-        """Extract all code blocks (bash commands)."""
-        # Match fenced code blocks
-        pattern = r'```(?:bash|sh)?\n(.*?)```'
-        matches = re.findall(pattern, content, re.DOTALL)
-
-        commands = []
-        for block in matches:
-            # Split into individual commands
-            for line in block.strip().split('\n'):
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    commands.append(line)
-
-        return commands
-
-    def _extract_metadata(self, content: str, key: str, default: str) -> str:
-        """Extract metadata from YAML frontmatter or inline comments."""
-        # Check YAML frontmatter
-        frontmatter_match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-        if frontmatter_match:
-            fm_content = frontmatter_match.group(1)
-            key_match = re.search(rf'^{key}:\s*(.+)$', fm_content, re.MULTILINE)
+        """Resolve metadata from YAML frontmatter, then inline comments."""
+        if frontmatter:
+            # Drop the newline that belongs to the closing '---'
+            fm_content = b"".join(frontmatter)[:-1]
+            key_match = _frontmatter_key_re(key).search(fm_content)
             if key_match:
-                return key_match.group(1).strip().strip('"\'')
+                return _decode(key_match.group(1)).strip().strip('"\'')
 
-        # Check inline comments
-        inline_match = re.search(rf'<!--\s*{key}:\s*(.+?)\s*-->', content)
-        if inline_match:
-            return inline_match.group(1).strip()
-
-        return default
+        return inline.get(key, default)
 
     def get_runbook(self, alert_name: str) -> Optional[Runbook]:
         """
@@ -200,17 +528,29 @@ class RunbookManager:
         Returns:
             Runbook or None if not found
         """
-        # Exact match
-        key = alert_name.lower()
-        if key in self.runbooks:
-            return self.runbooks[key]
+        # Exact match (keys are interned at load)
+        key = sys.intern(alert_name.lower())
+        runbook = self.runbooks.get(key)
+        if runbook is not None:
+            return runbook
+
+        # Partial match (alert name contains runbook name or vice versa).
+        # Candidates from both directions; the earliest-loaded one wins.
+        candidates = []
+
+        containing_key = self._substring_index.get(key)
+        if containing_key:
+            candidates.append(containing_key)
+
+        if self._key_automaton is not None:
+            candidates.extend(
+                runbook_key for _, runbook_key in self._key_automaton.iter(key)
+            )
 
-        # Partial match (alert name contains runbook name or vice versa)
-        for runbook_key, runbook in self.runbooks.items():
-            if runbook_key in key or key in runbook_key:
-                return runbook
+        if not candidates:
+            return None
 
-        return None
+        return self.runbooks[min(candidates, key=self._load_order.__getitem__)]
 
     def get_runbook_context(self, alert_name: str) -> str:
         """
@@ -223,9 +563,15 @@ class RunbookManager:
             Formatted string for system prompt, or empty string if no runbook
         """
         runbook = self.get_runbook(alert_name)
-        if not runbook:
-            return ""
+        return runbook.formatted_context if runbook else ""
 
+    def _format_context(self, runbook: Runbook) -> str:
+        """
+        Render a runbook as Claude context.
+
+        Called once per parse; the result is stored on the Runbook (and in
+        the parse cache), so get_runbook_context is a plain attribute read.
+        """
         context = f"""
 ## Runbook: {runbook.title}
 
@@ -254,19 +600,14 @@ class RunbookManager:
 """
         return context
 
-    def _format_list(self, items: List[str]) -> str:
+    def _format_list(self, items: Sequence[str]) -> str:
         """Format list items with numbers."""
         if not items:
             return "- No specific steps documented"
-        return "\n".join(f"{i+1}. {item}" for i, item in enumerate(items))
-
-    def list_runbooks(self) -> List[Dict]:
-        """
-        List all available runbooks.
+        return "\n".join([f"{i}. {item}" for i, item in enumerate(items, 1)])
 
-        Returns:
-            List of runbook summaries
-        """
+    def _build_summary(self) -> List[Dict]:
+        """Build the list_runbooks() summaries for the loaded runbooks."""
         return [
             {
                 "alert_name": rb.alert_name,
@@ -279,6 +620,15 @@ class RunbookManager:
             for rb in self.runbooks.values()
         ]
 
+    def list_runbooks(self) -> List[Dict]:
+        """
+        List all available runbooks.
+
+        Returns:
+            List of runbook summaries (shared, built at load - do not mutate)
+        """
+        return self._summary_cache
+
     def reload(self) -> int:
         """
         Reload all runbooks from disk.
@@ -286,7 +636,6 @@ class RunbookManager:
         Returns:
             Number of runbooks loaded
         """
-        self.runbooks.clear()
         return self.load_runbooks()
 
 
@@ -294,18 +643,22 @@ class RunbookManager:
 runbook_manager: Optional[RunbookManager] = None
 
 
-def init_runbook_manager(runbook_dir: str = "/app/runbooks") -> RunbookManager:
+def init_runbook_manager(
+    runbook_dir: str = "/app/runbooks",
+    cache_dir: Optional[str] = None
+) -> RunbookManager:
     """
     Initialize global runbook manager.
 
     Args:
         runbook_dir: Directory containing runbook files
+        cache_dir: Writable directory for the parsed-runbook cache
 
     Returns:
         RunbookManager instance
     """
     global runbook_manager
-    runbook_manager = RunbookManager(runbook_dir=runbook_dir)
+    runbook_manager = RunbookManager(runbook_dir=runbook_dir, cache_dir=cache_dir)
     runbook_manager.load_runbooks()
     return runbook_manager
 
@@ -10,19 +10,35 @@ This is the ONLY mechanism that can restart Jarvis or its critical dependencies.
 """
 
 import asyncio
-import json
-import uuid
+import secrets
+import asyncpg
+import orjson
 import structlog
-from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List, Set, Awaitable, ClassVar, Union
 from enum import Enum
+from itertools import islice
 
 from .config import settings
 from . import metrics
 
 logger = structlog.get_logger()
 
+_UTC = timezone.utc
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string (millisecond precision)."""
+    return datetime.now(_UTC).isoformat(timespec='milliseconds')
+
+
+def _parse_iso(value: Union[str, datetime]) -> datetime:
+    """Parse a stored ISO timestamp; older rows were written as naive UTC."""
+    parsed = value if isinstance(value, datetime) else datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=_UTC)
+
 
 class SelfRestartTarget(str, Enum):
     """Valid targets for self-restart operations."""
@@ -31,6 +47,11 @@ class SelfRestartTarget(str, Enum):
     SKYNET_HOST = "management-host-host"          # Full host restart
     DOCKER_DAEMON = "docker-daemon"      # Docker service on Management-Host
 
+    @property
+    def is_protected(self) -> bool:
+        """Whether this target can only be restarted via handoff."""
+        return self in _PROTECTED_TARGETS
+
 
 class HandoffStatus(str, Enum):
     """Status of a self-preservation handoff."""
@@ -42,7 +63,60 @@ class HandoffStatus(str, Enum):
     CANCELLED = "cancelled"      # Handoff was cancelled
 
 
-@dataclass
+# Targets that require this mechanism (blocked by command_validator normally)
+_PROTECTED_TARGETS = frozenset({
+    SelfRestartTarget.JARVIS,
+    SelfRestartTarget.POSTGRES_JARVIS,
+    SelfRestartTarget.SKYNET_HOST,
+    SelfRestartTarget.DOCKER_DAEMON,
+})
+
+# Handoffs in these states can no longer be cancelled
+_TERMINAL_STATUSES = frozenset({HandoffStatus.COMPLETED, HandoffStatus.FAILED})
+
+# Stored value -> member, for hydrating rows without going through Enum.__call__
+_RESTART_TARGETS: Dict[str, SelfRestartTarget] = {m.value: m for m in SelfRestartTarget}
+_HANDOFF_STATUSES: Dict[str, HandoffStatus] = {m.value: m for m in HandoffStatus}
+
+# SSH command n8n runs for each target
+_RESTART_COMMANDS: Dict[SelfRestartTarget, str] = {
+    SelfRestartTarget.JARVIS: "docker restart jarvis",
+    SelfRestartTarget.POSTGRES_JARVIS: "docker restart postgres-jarvis && sleep 10 && docker restart jarvis",
+    SelfRestartTarget.DOCKER_DAEMON: "sudo systemctl restart docker",
+    SelfRestartTarget.SKYNET_HOST: "sudo reboot",
+}
+
+# Discord notification templates
+_NOTIFY_USERNAME = "Jarvis - Self-Preservation"
+
+_INITIATED_TEMPLATE = """## Self-Restart Initiated
+
+**Handoff ID:** `{handoff_id}`
+**Target:** {target}
+**Reason:** {reason}
+**Time:** {created_at}
+
+Jarvis is handing off to n8n for restart orchestration.
+Will resume automatically after restart completes.
+
+{resume_note}
+"""
+_INITIATED_RESUME_NOTE = "**Remediation in progress will resume after restart.**"
+
+_COMPLETED_TEMPLATE = """## Self-Restart Completed
+
+**Handoff ID:** `{handoff_id}`
+**Target:** {target}
+**Status:** {status}{duration}
+
+Jarvis has successfully restarted and resumed operations.
+
+{resume_note}
+"""
+_COMPLETED_RESUME_NOTE = "**Resuming previous remediation...**"
+
+
+@dataclass(slots=True)
 class RemediationContext:
     """
     Serializable context of an in-progress remediation.
@@ -50,9 +124,33 @@ class RemediationContext:
     This is everything Jarvis needs to resume after a restart.
     """
     # HIGH-002 FIX: Size limits to prevent database issues
-    MAX_COMMANDS = 50  # Max commands to store
-    MAX_OUTPUT_LENGTH = 10000  # 10KB per output
-    MAX_ANALYSIS_LENGTH = 20000  # 20KB for AI analysis
+    MAX_COMMANDS: ClassVar[int] = 50  # Max commands to store
+    MAX_OUTPUT_LENGTH: ClassVar[int] = 10000  # 10KB per output
+    MAX_ANALYSIS_LENGTH: ClassVar[int] = 20000  # 20KB for AI analysis
+    MAX_PLANNED_COMMANDS: ClassVar[int] = 20
+
+    # from_dict() values for keys missing from older stored contexts
+    # (__setattr__ turns the tuple defaults into fresh lists; diagnostic_info
+    # gets a new dict per call in from_dict)
+    _FROM_DICT_DEFAULTS: ClassVar[Dict[str, Any]] = {
+        "alert_name": "unknown",
+        "alert_instance": "unknown",
+        "alert_fingerprint": "unknown",
+        "severity": "warning",
+        "attempt_number": 1,
+        "commands_executed": (),
+        "command_outputs": (),
+        "diagnostic_info": None,
+        "ai_analysis": None,
+        "ai_reasoning": None,
+        "planned_commands": (),
+        "target_host": "unknown",
+        "service_name": None,
+        "service_type": None,
+        "started_at": None,
+        "restart_count": 0,
+        "max_restarts": 2,
+    }
 
     # Alert identification
     alert_name: str
@@ -83,40 +181,91 @@ class RemediationContext:
     restart_count: int = 0
     max_restarts: int = 2
 
+    # Cached _as_dict() / to_json() results; cleared whenever a field is assigned
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _json_cache: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         if self.planned_commands is None:
             self.planned_commands = []
         if self.started_at is None:
-            self.started_at = datetime.utcnow().isoformat()
+            self.started_at = _now_iso()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # HIGH-002 FIX: Size limits are enforced as values come in (this also
+        # covers the dataclass __init__), so to_dict() never re-truncates
+        if name == "commands_executed":
+            value = list(islice(value, self.MAX_COMMANDS))
+        elif name == "command_outputs":
+            limit = self.MAX_OUTPUT_LENGTH
+            value = [
+                (o[:limit] + "\n...(truncated)") if o and len(o) > limit else (o or "")
+                for o in islice(value, self.MAX_COMMANDS)
+            ]
+        elif name in ("ai_analysis", "ai_reasoning"):
+            if value and len(value) > self.MAX_ANALYSIS_LENGTH:
+                value = value[:self.MAX_ANALYSIS_LENGTH] + "\n...(truncated)"
+        elif name == "planned_commands" and value is not None:
+            value = list(islice(value, self.MAX_PLANNED_COMMANDS))
+
+        object.__setattr__(self, name, value)
+        if name not in ("_dict_cache", "_json_cache"):
+            object.__setattr__(self, "_dict_cache", None)
+            object.__setattr__(self, "_json_cache", None)
+
+    @classmethod
+    def _truncate_output(cls, output: Optional[str]) -> str:
+        """Apply the per-output size limit."""
+        if output and len(output) > cls.MAX_OUTPUT_LENGTH:
+            return output[:cls.MAX_OUTPUT_LENGTH] + "\n...(truncated)"
+        return output or ""
+
+    def append_command(self, command: str, output: Optional[str]) -> None:
+        """
+        Record an executed command and its output within the size limits.
+
+        Use this instead of appending to the lists directly so the cached
+        dict/JSON results are invalidated.
+        """
+        if len(self.commands_executed) >= self.MAX_COMMANDS:
+            return
+        self.commands_executed.append(command)
+        self.command_outputs.append(self._truncate_output(output))
+        self._dict_cache = None
+        self._json_cache = None
+
+    def approx_size(self) -> int:
+        """Rough encoded size in characters, dominated by outputs and analysis."""
+        return (
+            sum(map(len, self.command_outputs))
+            + sum(map(len, self.commands_executed))
+            + len(self.ai_analysis or "")
+            + len(self.ai_reasoning or "")
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert to dictionary for JSON serialization.
 
-        HIGH-002 FIX: Applies size limits to prevent database overflow.
+        HIGH-002 FIX: Size limits are applied when fields are set. The
+        returned dict is a copy (lists and diagnostic_info included), so
+        changing it never bypasses the limits or the cache.
         """
-        # Truncate commands list
-        commands = self.commands_executed[:self.MAX_COMMANDS]
-        outputs = self.command_outputs[:self.MAX_COMMANDS]
-
-        # Truncate individual outputs
-        truncated_outputs = []
-        for output in outputs:
-            if output and len(output) > self.MAX_OUTPUT_LENGTH:
-                truncated_outputs.append(
-                    output[:self.MAX_OUTPUT_LENGTH] + "\n...(truncated)"
-                )
-            else:
-                truncated_outputs.append(output or "")
-
-        # Truncate AI analysis
-        ai_analysis = self.ai_analysis
-        if ai_analysis and len(ai_analysis) > self.MAX_ANALYSIS_LENGTH:
-            ai_analysis = ai_analysis[:self.MAX_ANALYSIS_LENGTH] + "\n...(truncated)"
+        result = dict(self._as_dict())
+        for key in ("commands_executed", "command_outputs", "planned_commands"):
+            result[key] = list(result[key])
+        if result["diagnostic_info"] is not None:
+            result["diagnostic_info"] = dict(result["diagnostic_info"])
+        return result
 
-        ai_reasoning = self.ai_reasoning
-        if ai_reasoning and len(ai_reasoning) > self.MAX_ANALYSIS_LENGTH:
-            ai_reasoning = ai_reasoning[:self.MAX_ANALYSIS_LENGTH] + "\n...(truncated)"
+    def _as_dict(self) -> Dict[str, Any]:
+        """Field dict shared with to_json(), cached until the context changes."""
+        if self._dict_cache is not None:
+            return self._dict_cache
 
         # Build result dict
         result = {
@@ -125,12 +274,12 @@ class RemediationContext:
             "alert_fingerprint": self.alert_fingerprint,
             "severity": self.severity,
             "attempt_number": self.attempt_number,
-            "commands_executed": commands,
-            "command_outputs": truncated_outputs,
+            "commands_executed": self.commands_executed,
+            "command_outputs": self.command_outputs,
             "diagnostic_info": self.diagnostic_info,
-            "ai_analysis": ai_analysis,
-            "ai_reasoning": ai_reasoning,
-            "planned_commands": (self.planned_commands or [])[:20],  # Limit planned too
+            "ai_analysis": self.ai_analysis,
+            "ai_reasoning": self.ai_reasoning,
+            "planned_commands": self.planned_commands,
             "target_host": self.target_host,
             "service_name": self.service_name,
             "service_type": self.service_type,
@@ -139,56 +288,53 @@ class RemediationContext:
             "max_restarts": self.max_restarts,
         }
 
-        # Validate serialization works
-        try:
-            json.dumps(result)
-        except (TypeError, ValueError) as e:
-            # Return minimal safe context if serialization fails
-            logger.warning(
-                "context_serialization_fallback",
-                error=str(e),
-                alert_name=self.alert_name
-            )
-            return {
-                "alert_name": self.alert_name,
-                "alert_instance": self.alert_instance,
-                "alert_fingerprint": self.alert_fingerprint,
-                "severity": self.severity,
-                "attempt_number": self.attempt_number,
-                "target_host": self.target_host,
-                "restart_count": self.restart_count,
-                "max_restarts": self.max_restarts,
-                "error": f"Context too large or complex to serialize: {str(e)}"
-            }
-
+        self._dict_cache = result
         return result
 
+    def to_json(self) -> str:
+        """
+        Encode for the remediation_context column (cached like to_dict).
+
+        OPT_NON_STR_KEYS keeps parity with json.dumps for diagnostic_info
+        dicts keyed by ints. If diagnostic_info holds something that cannot
+        be encoded, a minimal context is stored instead.
+        """
+        if self._json_cache is None:
+            try:
+                encoded = orjson.dumps(self._as_dict(), option=orjson.OPT_NON_STR_KEYS)
+            except TypeError as e:
+                # Return minimal safe context if serialization fails
+                logger.warning(
+                    "context_serialization_fallback",
+                    error=str(e),
+                    alert_name=self.alert_name
+                )
+                encoded = orjson.dumps({
+                    "alert_name": self.alert_name,
+                    "alert_instance": self.alert_instance,
+                    "alert_fingerprint": self.alert_fingerprint,
+                    "severity": self.severity,
+                    "attempt_number": self.attempt_number,
+                    "target_host": self.target_host,
+                    "restart_count": self.restart_count,
+                    "max_restarts": self.max_restarts,
+                    "error": f"Context too large or complex to serialize: {str(e)}"
+                })
+            self._json_cache = encoded.decode()
+        return self._json_cache
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RemediationContext":
         """Create from dictionary."""
-        # Handle both old format (without restart_count) and new format
-        return cls(
-            alert_name=data.get("alert_name", "unknown"),
-            alert_instance=data.get("alert_instance", "unknown"),
-            alert_fingerprint=data.get("alert_fingerprint", "unknown"),
-            severity=data.get("severity", "warning"),
-            attempt_number=data.get("attempt_number", 1),
-            commands_executed=data.get("commands_executed", []),
-            command_outputs=data.get("command_outputs", []),
-            diagnostic_info=data.get("diagnostic_info", {}),
-            ai_analysis=data.get("ai_analysis"),
-            ai_reasoning=data.get("ai_reasoning"),
-            planned_commands=data.get("planned_commands", []),
-            target_host=data.get("target_host", "unknown"),
-            service_name=data.get("service_name"),
-            service_type=data.get("service_type"),
-            started_at=data.get("started_at"),
-            restart_count=data.get("restart_count", 0),
-            max_restarts=data.get("max_restarts", 2),
-        )
+        # Handle both old format (without restart_count) and new format:
+        # start from the defaults and overlay whichever known keys are stored
+        # (unknown keys, e.g. the serialization fallback's "error", are ignored)
+        kwargs = {**cls._FROM_DICT_DEFAULTS, "diagnostic_info": {}}
+        kwargs.update({key: data[key] for key in data.keys() & cls._FROM_DICT_DEFAULTS.keys()})
+        return cls(**kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class SelfPreservationHandoff:
     """
     A handoff record for self-restart operations.
@@ -206,6 +352,17 @@ class SelfPreservationHandoff:
     completed_at: Optional[str] = None
     error_message: Optional[str] = None
 
+    # created_at parsed once, for duration math (None if unparseable)
+    created_at_dt: Optional[datetime] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        try:
+            self.created_at_dt = _parse_iso(self.created_at)
+        except (TypeError, ValueError):
+            self.created_at_dt = None
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         result = {
@@ -227,10 +384,10 @@ class SelfPreservationHandoff:
         """Create from dictionary."""
         return cls(
             handoff_id=data["handoff_id"],
-            restart_target=SelfRestartTarget(data["restart_target"]),
+            restart_target=_RESTART_TARGETS[data["restart_target"]],
             restart_reason=data["restart_reason"],
             remediation_context=RemediationContext.from_dict(data["remediation_context"]) if data.get("remediation_context") else None,
-            status=HandoffStatus(data["status"]),
+            status=_HANDOFF_STATUSES[data["status"]],
             created_at=data["created_at"],
             callback_url=data["callback_url"],
             n8n_execution_id=data.get("n8n_execution_id"),
@@ -255,13 +412,46 @@ class SelfPreservationManager:
     # Webhook path that n8n will call
     N8N_SELF_RESTART_WEBHOOK = "/webhook/jarvis-self-restart"
 
+    # Handoff SQL, shared by every call site. Identical statement text means
+    # asyncpg parses/prepares each one once per pooled connection and reuses
+    # it from the connection's statement cache (an explicit conn.prepare()
+    # bypasses that cache and would re-prepare on every call).
+    SAVE_HANDOFF_SQL = """
+        INSERT INTO self_preservation_handoffs (
+            handoff_id, restart_target, restart_reason,
+            remediation_context, status, callback_url,
+            n8n_execution_id, error_message, created_at, completed_at
+        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+        ON CONFLICT (handoff_id) DO UPDATE SET
+            status = EXCLUDED.status,
+            n8n_execution_id = EXCLUDED.n8n_execution_id,
+            error_message = EXCLUDED.error_message,
+            completed_at = EXCLUDED.completed_at
+    """
+
+    # One statement for both loaders: a handoff by ID, or (with a NULL ID)
+    # the most recent pending/in_progress one
+    LOAD_HANDOFF_SQL = """
+        SELECT handoff_id, restart_target, restart_reason,
+               remediation_context, status, callback_url,
+               n8n_execution_id, error_message, created_at, completed_at
+        FROM self_preservation_handoffs
+        WHERE handoff_id = $1
+           OR ($1::text IS NULL AND status IN ('pending', 'in_progress'))
+        ORDER BY created_at DESC
+        LIMIT 1
+    """
+
+    # Finished (completed/failed) handoffs never change again, so up to this
+    # many are kept in memory for repeat lookups by ID
+    HANDOFF_CACHE_SIZE = 128
+
+    # Contexts larger than this (approx. characters) are JSON-encoded in a
+    # worker thread so a big AI analysis doesn't stall the event loop
+    CONTEXT_OFFLOAD_SIZE = 4096
+
     # Targets that require this mechanism (blocked by command_validator normally)
-    PROTECTED_TARGETS = {
-        SelfRestartTarget.JARVIS,
-        SelfRestartTarget.POSTGRES_JARVIS,
-        SelfRestartTarget.SKYNET_HOST,
-        SelfRestartTarget.DOCKER_DAEMON,
-    }
+    PROTECTED_TARGETS = _PROTECTED_TARGETS
 
     def __init__(self, db, n8n_client=None, discord_notifier=None):
         """
@@ -279,18 +469,30 @@ class SelfPreservationManager:
 
         # In-memory tracking of active handoff (there can only be one)
         self._active_handoff: Optional[SelfPreservationHandoff] = None
+        self._handoff_lock = asyncio.Lock()
+
+        # LRU of finished handoffs loaded by _load_handoff
+        self._handoff_cache: OrderedDict[str, SelfPreservationHandoff] = OrderedDict()
+
+        # Fire-and-forget Discord notifications (strong refs until done)
+        self._pending_notifications: Set[asyncio.Task] = set()
 
         # Jarvis API URL (for n8n to call back)
-        # Use explicit external URL if configured, otherwise fall back to ssh_management-host_host
+        # Use explicit external URL if configured, otherwise fall back to ssh_skynet_host
         if settings.jarvis_external_url:
             self._jarvis_url = settings.jarvis_external_url
         else:
-            self._jarvis_url = f"http://{settings.ssh_management-host_host}:{settings.port}"
+            self._jarvis_url = f"http://{settings.ssh_skynet_host}:{settings.port}"
             self.logger.warning(
                 "jarvis_external_url_not_configured",
                 fallback_url=self._jarvis_url,
                 message="Set JARVIS_EXTERNAL_URL for reliable n8n callbacks"
             )
+        self._callback_url = f"{self._jarvis_url}/resume"
+
+        # Host n8n SSHes into to run the restart command
+        self._ssh_host = settings.ssh_skynet_host
+        self._ssh_user = settings.ssh_skynet_user
 
     async def initiate_self_restart(
         self,
@@ -302,8 +504,8 @@ class SelfPreservationManager:
         """
         Initiate a self-restart operation via n8n handoff.
 
-        HIGH-006 FIX: Uses database transaction with advisory lock to prevent
-        concurrent restart race conditions.
+        HIGH-006 FIX: A unique partial index (at most one pending/in_progress
+        handoff) prevents concurrent restart race conditions.
 
         Args:
             target: What to restart (jarvis, postgres-jarvis, etc.)
@@ -314,8 +516,10 @@ class SelfPreservationManager:
         Returns:
             Dict with handoff_id and status
         """
+        # Cheap rejections first, before queueing on the lock or touching the pool
+
         # Validate target
-        if target not in self.PROTECTED_TARGETS:
+        if not target.is_protected:
             return {
                 "success": False,
                 "error": f"Target {target.value} is not a protected target"
@@ -334,161 +538,170 @@ class SelfPreservationManager:
                 "error": f"Maximum restart count ({remediation_context.max_restarts}) reached for this remediation"
             }
 
-        # HIGH-006 FIX: Use database transaction with advisory lock
-        # to prevent race condition where two concurrent restart requests
-        # both check for active handoff, find none, then both create one
-        try:
-            async with self.db.pool.acquire() as conn:
-                async with conn.transaction():
-                    # Acquire advisory lock (unique key for self-restart operations)
-                    # This blocks other initiate_self_restart calls until we're done
-                    await conn.execute("SELECT pg_advisory_xact_lock(123456789)")
-
-                    # Check for existing active handoff in database (not just memory)
-                    existing = await conn.fetchrow("""
-                        SELECT handoff_id, status
-                        FROM self_preservation_handoffs
-                        WHERE status IN ('pending', 'in_progress')
-                        LIMIT 1
-                    """)
-
-                    if existing:
-                        return {
-                            "success": False,
-                            "error": f"Existing handoff {existing['handoff_id']} is still active (status: {existing['status']})"
-                        }
+        # Fast path: a handoff known to this process is still running
+        rejection = self._reject_if_active()
+        if rejection:
+            return rejection
+
+        # In-process lock: concurrent requests from this instance queue here
+        # instead of each taking a pool connection (the database's unique
+        # index still guards against other processes)
+        async with self._handoff_lock:
+            # Re-check: a request we queued behind may have started one
+            rejection = self._reject_if_active()
+            if rejection:
+                return rejection
+
+            # Generate handoff ID
+            handoff_id = f"sp-{secrets.token_hex(6)}"
+
+            # Increment restart count if resuming
+            if remediation_context:
+                remediation_context.restart_count += 1
+
+            # Create handoff record
+            handoff = SelfPreservationHandoff(
+                handoff_id=handoff_id,
+                restart_target=target,
+                restart_reason=reason,
+                remediation_context=remediation_context,
+                status=HandoffStatus.PENDING,
+                created_at=_now_iso(),
+                callback_url=self._callback_url
+            )
 
-                    # Generate handoff ID
-                    handoff_id = f"sp-{uuid.uuid4().hex[:12]}"
+            # HIGH-006 FIX: The idx_sp_one_active_handoff unique index makes the
+            # database reject a second pending/in_progress handoff atomically,
+            # so two concurrent requests can't both create one - no advisory
+            # lock or check-then-insert transaction needed
+            rejected = False
+            try:
+                context_json = await self._encode_context(handoff.remediation_context)
+                async with self.db.pool.acquire() as conn:
+                    try:
+                        await conn.execute(
+                            self.SAVE_HANDOFF_SQL,
+                            handoff.handoff_id,
+                            handoff.restart_target.value,
+                            handoff.restart_reason,
+                            context_json,
+                            handoff.status.value,
+                            handoff.callback_url,
+                            handoff.n8n_execution_id,
+                            handoff.error_message,
+                            handoff.created_at,
+                            handoff.completed_at
+                        )
+                    except asyncpg.UniqueViolationError:
+                        rejected = True
+
+                        # Remember the handoff holding the slot so later
+                        # requests are rejected on the fast path (loaded on
+                        # this connection rather than acquiring another)
+                        try:
+                            self._active_handoff = await self._load_latest_pending_handoff(conn)
+                        except Exception as e:
+                            self.logger.warning("active_handoff_load_failed", error=str(e))
+
+            except Exception as e:
+                self.logger.error(
+                    "handoff_persistence_failed",
+                    handoff_id=handoff_id,
+                    error=str(e)
+                )
+                metrics.record_self_restart_failure(target.value, "handoff_save_failed")
+                return {
+                    "success": False,
+                    "error": f"Failed to persist handoff: {str(e)}"
+                }
 
-                    # Build callback URL
-                    callback_url = f"{self._jarvis_url}/resume"
+            if rejected:
+                # Rejected: this restart never happened
+                if remediation_context:
+                    remediation_context.restart_count -= 1
 
-                    # Increment restart count if resuming
-                    if remediation_context:
-                        remediation_context.restart_count += 1
+                return self._reject_if_active() or {
+                    "success": False,
+                    "error": "Another handoff is still active"
+                }
 
-                    # Create handoff record
-                    handoff = SelfPreservationHandoff(
-                        handoff_id=handoff_id,
-                        restart_target=target,
-                        restart_reason=reason,
-                        remediation_context=remediation_context,
-                        status=HandoffStatus.PENDING,
-                        created_at=datetime.utcnow().isoformat(),
-                        callback_url=callback_url
-                    )
+            self.logger.info(
+                "initiating_self_restart",
+                handoff_id=handoff_id,
+                target=target.value,
+                reason=reason,
+                has_context=remediation_context is not None,
+                restart_count=remediation_context.restart_count if remediation_context else 0
+            )
 
-                    self.logger.info(
-                        "initiating_self_restart",
-                        handoff_id=handoff_id,
-                        target=target.value,
-                        reason=reason,
-                        has_context=remediation_context is not None,
-                        restart_count=remediation_context.restart_count if remediation_context else 0
-                    )
+            # Notify Discord in the background; the webhook call overlaps with
+            # the n8n trigger below instead of running before it
+            if self.discord_notifier:
+                self._notify_in_background(
+                    self._notify_self_restart_initiated(handoff),
+                    handoff.handoff_id
+                )
 
-                    # Insert handoff within transaction
-                    context_json = json.dumps(handoff.remediation_context.to_dict()) if handoff.remediation_context else None
-                    await conn.execute("""
-                        INSERT INTO self_preservation_handoffs (
-                            handoff_id, restart_target, restart_reason,
-                            remediation_context, status, callback_url,
-                            n8n_execution_id, error_message, created_at, completed_at
-                        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-                    """,
-                        handoff.handoff_id,
-                        handoff.restart_target.value,
-                        handoff.restart_reason,
-                        context_json,
-                        handoff.status.value,
-                        handoff.callback_url,
-                        handoff.n8n_execution_id,
-                        handoff.error_message,
-                        handoff.created_at,
-                        handoff.completed_at
+            # Trigger n8n workflow
+            if self.n8n_client:
+                try:
+                    n8n_result = await self._trigger_n8n_restart_workflow(
+                        handoff=handoff,
+                        timeout_minutes=timeout_minutes
                     )
-                    # Transaction commits here, advisory lock is released
 
-        except Exception as e:
-            self.logger.error(
-                "handoff_persistence_failed",
-                handoff_id=handoff_id if 'handoff_id' in dir() else 'unknown',
-                error=str(e)
-            )
-            metrics.record_self_restart_failure(target.value, "handoff_save_failed")
-            return {
-                "success": False,
-                "error": f"Failed to persist handoff: {str(e)}"
-            }
+                    if not n8n_result.get("success"):
+                        # n8n trigger failed - abort handoff
+                        handoff.status = HandoffStatus.FAILED
+                        handoff.error_message = n8n_result.get("error", "n8n trigger failed")
+                        await self._save_handoff(handoff)
 
-        # Notify Discord
-        if self.discord_notifier:
-            try:
-                await self._notify_self_restart_initiated(handoff)
-            except Exception as e:
-                self.logger.warning("discord_notification_failed", error=str(e))
+                        metrics.record_self_restart(target.value, "failure")
+                        metrics.record_self_restart_failure(target.value, "n8n_trigger_failed")
+                        return {
+                            "success": False,
+                            "error": f"n8n workflow trigger failed: {n8n_result.get('error')}"
+                        }
 
-        # Trigger n8n workflow
-        if self.n8n_client:
-            try:
-                n8n_result = await self._trigger_n8n_restart_workflow(
-                    handoff=handoff,
-                    timeout_minutes=timeout_minutes
-                )
+                    # Update with n8n execution ID
+                    handoff.n8n_execution_id = n8n_result.get("execution_id")
+                    handoff.status = HandoffStatus.IN_PROGRESS
+                    await self._save_handoff(handoff)
+
+                    # Record that self-restart is now active
+                    metrics.set_self_restart_active(True)
 
-                if not n8n_result.get("success"):
-                    # n8n trigger failed - abort handoff
+                except Exception as e:
+                    self.logger.error(
+                        "n8n_trigger_exception",
+                        handoff_id=handoff_id,
+                        error=str(e)
+                    )
                     handoff.status = HandoffStatus.FAILED
-                    handoff.error_message = n8n_result.get("error", "n8n trigger failed")
+                    handoff.error_message = str(e)
                     await self._save_handoff(handoff)
 
                     metrics.record_self_restart(target.value, "failure")
                     metrics.record_self_restart_failure(target.value, "n8n_trigger_failed")
                     return {
                         "success": False,
-                        "error": f"n8n workflow trigger failed: {n8n_result.get('error')}"
+                        "error": f"n8n workflow exception: {str(e)}"
                     }
-
-                # Update with n8n execution ID
-                handoff.n8n_execution_id = n8n_result.get("execution_id")
-                handoff.status = HandoffStatus.IN_PROGRESS
-                await self._save_handoff(handoff)
-
-                # Record that self-restart is now active
-                metrics.set_self_restart_active(True)
-
-            except Exception as e:
-                self.logger.error(
-                    "n8n_trigger_exception",
+            else:
+                self.logger.warning(
+                    "n8n_client_not_available",
                     handoff_id=handoff_id,
-                    error=str(e)
+                    message="n8n not configured - handoff saved but restart must be manual"
                 )
-                handoff.status = HandoffStatus.FAILED
-                handoff.error_message = str(e)
-                await self._save_handoff(handoff)
-
-                metrics.record_self_restart(target.value, "failure")
-                metrics.record_self_restart_failure(target.value, "n8n_trigger_failed")
-                return {
-                    "success": False,
-                    "error": f"n8n workflow exception: {str(e)}"
-                }
-        else:
-            self.logger.warning(
-                "n8n_client_not_available",
-                handoff_id=handoff_id,
-                message="n8n not configured - handoff saved but restart must be manual"
-            )
 
-        self._active_handoff = handoff
+            self._active_handoff = handoff
 
-        return {
-            "success": True,
-            "handoff_id": handoff_id,
-            "status": handoff.status.value,
-            "message": f"Self-restart initiated for {target.value}. Jarvis will resume after restart."
-        }
+            return {
+                "success": True,
+                "handoff_id": handoff_id,
+                "status": handoff.status.value,
+                "message": f"Self-restart initiated for {target.value}. Jarvis will resume after restart."
+            }
 
     async def resume_from_handoff(
         self,
@@ -540,17 +753,16 @@ class SelfPreservationManager:
             }
 
         # Mark handoff as completed
+        now = datetime.now(_UTC)
         handoff.status = HandoffStatus.COMPLETED
-        handoff.completed_at = datetime.utcnow().isoformat()
+        handoff.completed_at = now.isoformat(timespec='milliseconds')
         await self._save_handoff(handoff)
 
         # Calculate duration and record metrics
-        try:
-            start = datetime.fromisoformat(handoff.created_at)
-            end = datetime.fromisoformat(handoff.completed_at)
-            duration_seconds = (end - start).total_seconds()
+        if handoff.created_at_dt is not None:
+            duration_seconds = (now - handoff.created_at_dt).total_seconds()
             metrics.record_self_restart(handoff.restart_target.value, "success", duration_seconds)
-        except Exception:
+        else:
             metrics.record_self_restart(handoff.restart_target.value, "success")
 
         metrics.set_self_restart_active(False)
@@ -558,12 +770,12 @@ class SelfPreservationManager:
         # Clear active handoff
         self._active_handoff = None
 
-        # Notify Discord
+        # Notify Discord (don't wait on the webhook)
         if self.discord_notifier:
-            try:
-                await self._notify_self_restart_completed(handoff)
-            except Exception as e:
-                self.logger.warning("discord_notification_failed", error=str(e))
+            self._notify_in_background(
+                self._notify_self_restart_completed(handoff),
+                handoff.handoff_id
+            )
 
         self.logger.info(
             "handoff_resumed_successfully",
@@ -615,69 +827,54 @@ class SelfPreservationManager:
         Called during startup to prevent old in_progress handoffs from
         blocking new self-restart requests forever.
 
-        HIGH-004 FIX: Added LIMIT to prevent unbounded queries.
+        HIGH-004 FIX: Bounded by the WHERE clause - idx_sp_one_active_handoff
+        allows at most one pending/in_progress handoff.
 
         Returns:
             Number of handoffs cleaned up
         """
         max_age_minutes = settings.stale_handoff_cleanup_minutes
 
-        # HIGH-004 FIX: Use LIMIT to prevent unbounded cleanup
-        # Process in batches of 100 to avoid exhausting DB connections
+        # Single parameterized UPDATE: one round trip and a stable plan.
+        # created_at is an offset-aware ISO string (_now_iso), so it casts
+        # to timestamptz and compares directly against NOW(). Legacy
+        # naive-UTC rows are read in the session time zone (UTC by default).
         query = """
             UPDATE self_preservation_handoffs
             SET status = 'timeout',
                 error_message = 'Cleanup: no callback received within timeout',
                 completed_at = NOW()
-            WHERE handoff_id IN (
-                SELECT handoff_id
-                FROM self_preservation_handoffs
-                WHERE status IN ('pending', 'in_progress')
-                AND created_at < NOW() - INTERVAL '%s minutes'
-                LIMIT 100
-            )
+            WHERE status IN ('pending', 'in_progress')
+            AND created_at::timestamptz < NOW() - INTERVAL '1 minute' * $1
             RETURNING handoff_id, restart_target, created_at
         """
 
         try:
-            total_cleaned = 0
-
-            # Process in batches until no more stale handoffs
-            while True:
-                async with self.db.pool.acquire() as conn:
-                    # PostgreSQL doesn't support parameterized interval, use string formatting
-                    formatted_query = query.replace('%s', str(max_age_minutes))
-                    rows = await conn.fetch(formatted_query)
-
-                if not rows:
-                    break
-
-                batch_count = len(rows)
-                total_cleaned += batch_count
-
-                for row in rows:
-                    self.logger.warning(
-                        "stale_handoff_cleaned",
-                        handoff_id=row['handoff_id'],
-                        target=row['restart_target'],
-                        created_at=row['created_at'],
-                        max_age_minutes=max_age_minutes
-                    )
-                    # Record timeout metric
-                    metrics.record_self_restart(row['restart_target'], 'timeout')
+            async with self.db.pool.acquire() as conn:
+                rows = await conn.fetch(query, max_age_minutes)
+
+            for row in rows:
+                self.logger.warning(
+                    "stale_handoff_cleaned",
+                    handoff_id=row['handoff_id'],
+                    target=row['restart_target'],
+                    created_at=row['created_at'],
+                    max_age_minutes=max_age_minutes
+                )
+                # Record timeout metric
+                metrics.record_self_restart(row['restart_target'], 'timeout')
 
-                # If we got fewer than 100, we're done
-                if batch_count < 100:
-                    break
+                if self._active_handoff and self._active_handoff.handoff_id == row['handoff_id']:
+                    self._active_handoff = None
 
-            if total_cleaned > 0:
+            if rows:
                 self.logger.info(
                     "stale_handoffs_cleanup_complete",
-                    cleaned_count=total_cleaned,
+                    cleaned_count=len(rows),
                     max_age_minutes=max_age_minutes
                 )
 
-            return total_cleaned
+            return len(rows)
 
         except Exception as e:
             self.logger.error(
@@ -705,11 +902,11 @@ class SelfPreservationManager:
         if not handoff:
             return {"success": False, "error": f"Handoff {handoff_id} not found"}
 
-        if handoff.status in (HandoffStatus.COMPLETED, HandoffStatus.FAILED):
+        if handoff.status in _TERMINAL_STATUSES:
             return {"success": False, "error": f"Handoff already in terminal state: {handoff.status.value}"}
 
         handoff.status = HandoffStatus.CANCELLED
-        handoff.completed_at = datetime.utcnow().isoformat()
+        handoff.completed_at = _now_iso()
         handoff.error_message = reason
         await self._save_handoff(handoff)
 
@@ -740,38 +937,57 @@ class SelfPreservationManager:
         Returns:
             SSH command string
         """
-        commands = {
-            SelfRestartTarget.JARVIS: "docker restart jarvis",
-            SelfRestartTarget.POSTGRES_JARVIS: "docker restart postgres-jarvis && sleep 10 && docker restart jarvis",
-            SelfRestartTarget.DOCKER_DAEMON: "sudo systemctl restart docker",
-            SelfRestartTarget.SKYNET_HOST: "sudo reboot",
-        }
-        return commands.get(target, f"echo 'Unknown target: {target.value}'")
+        return _RESTART_COMMANDS.get(target, f"echo 'Unknown target: {target.value}'")
 
     # =========================================================================
     # Private methods
     # =========================================================================
 
+    def _reject_if_active(self) -> Optional[Dict[str, Any]]:
+        """Error result if the known active handoff is still pending/in progress."""
+        active = self._active_handoff
+        if active and active.status in (HandoffStatus.PENDING, HandoffStatus.IN_PROGRESS):
+            return {
+                "success": False,
+                "error": f"Existing handoff {active.handoff_id} is still active (status: {active.status.value})"
+            }
+        return None
+
+    async def _encode_context(
+        self,
+        context: Optional[RemediationContext]
+    ) -> Optional[orjson.Fragment]:
+        """
+        JSON-encode a remediation context for the JSONB column.
+
+        Large contexts are encoded off the event loop. The result is cached
+        on the context, so re-saving a handoff after a status change doesn't
+        encode an unchanged context again. It is returned as an
+        orjson.Fragment, which the pool's JSONB codec emits verbatim instead
+        of encoding the dict a second time.
+        """
+        if context is None:
+            return None
+        if context._json_cache is not None:
+            return orjson.Fragment(context._json_cache)
+        if context.approx_size() > self.CONTEXT_OFFLOAD_SIZE:
+            loop = asyncio.get_running_loop()
+            return orjson.Fragment(await loop.run_in_executor(None, context.to_json))
+        return orjson.Fragment(context.to_json())
+
     async def _save_handoff(self, handoff: SelfPreservationHandoff) -> None:
-        """Save or update handoff in database."""
-        query = """
-            INSERT INTO self_preservation_handoffs (
-                handoff_id, restart_target, restart_reason,
-                remediation_context, status, callback_url,
-                n8n_execution_id, error_message, created_at, completed_at
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-            ON CONFLICT (handoff_id) DO UPDATE SET
-                status = EXCLUDED.status,
-                n8n_execution_id = EXCLUDED.n8n_execution_id,
-                error_message = EXCLUDED.error_message,
-                completed_at = EXCLUDED.completed_at
         """
+        Save or update handoff in database.
 
-        context_json = json.dumps(handoff.remediation_context.to_dict()) if handoff.remediation_context else None
+        A finished handoff is cached as written, so a later lookup by ID
+        doesn't read back the row we just stored.
+        """
+        self._handoff_cache.pop(handoff.handoff_id, None)
+        context_json = await self._encode_context(handoff.remediation_context)
 
         async with self.db.pool.acquire() as conn:
             await conn.execute(
-                query,
+                self.SAVE_HANDOFF_SQL,
                 handoff.handoff_id,
                 handoff.restart_target.value,
                 handoff.restart_reason,
@@ -784,33 +1000,25 @@ class SelfPreservationManager:
                 handoff.completed_at
             )
 
-    async def _load_handoff(self, handoff_id: str) -> Optional[SelfPreservationHandoff]:
-        """Load handoff from database."""
-        query = """
-            SELECT handoff_id, restart_target, restart_reason,
-                   remediation_context, status, callback_url,
-                   n8n_execution_id, error_message, created_at, completed_at
-            FROM self_preservation_handoffs
-            WHERE handoff_id = $1
-        """
+        if handoff.status in _TERMINAL_STATUSES:
+            self._cache_handoff(handoff)
 
-        async with self.db.pool.acquire() as conn:
-            row = await conn.fetchrow(query, handoff_id)
-
-        if not row:
-            return None
-
-        context = None
-        if row['remediation_context']:
-            context_data = json.loads(row['remediation_context'])
-            context = RemediationContext.from_dict(context_data)
+    def _cache_handoff(self, handoff: SelfPreservationHandoff) -> None:
+        """Add a finished handoff to the LRU, evicting the oldest entry."""
+        self._handoff_cache[handoff.handoff_id] = handoff
+        if len(self._handoff_cache) > self.HANDOFF_CACHE_SIZE:
+            self._handoff_cache.popitem(last=False)
 
+    def _row_to_handoff(self, row: asyncpg.Record) -> SelfPreservationHandoff:
+        """Build a handoff from a self_preservation_handoffs row."""
+        # JSONB: the pool's codec has already decoded it to a dict
+        context_data = row['remediation_context']
         return SelfPreservationHandoff(
             handoff_id=row['handoff_id'],
-            restart_target=SelfRestartTarget(row['restart_target']),
+            restart_target=_RESTART_TARGETS[row['restart_target']],
             restart_reason=row['restart_reason'],
-            remediation_context=context,
-            status=HandoffStatus(row['status']),
+            remediation_context=RemediationContext.from_dict(context_data) if context_data else None,
+            status=_HANDOFF_STATUSES[row['status']],
             callback_url=row['callback_url'],
             n8n_execution_id=row['n8n_execution_id'],
             error_message=row['error_message'],
@@ -818,41 +1026,73 @@ class SelfPreservationManager:
             completed_at=row['completed_at']
         )
 
-    async def _load_latest_pending_handoff(self) -> Optional[SelfPreservationHandoff]:
+    async def _load_handoff(
+        self,
+        handoff_id: str,
+        conn: Optional[asyncpg.Connection] = None
+    ) -> Optional[SelfPreservationHandoff]:
+        """Load handoff from database (finished handoffs come from the cache)."""
+        cached = self._handoff_cache.get(handoff_id)
+        if cached is not None:
+            self._handoff_cache.move_to_end(handoff_id)
+            return cached
+
+        handoff = await self._load_pending_or_by_id(handoff_id, conn)
+        if not handoff:
+            return None
+
+        if handoff.status in _TERMINAL_STATUSES:
+            self._cache_handoff(handoff)
+
+        return handoff
+
+    async def _load_latest_pending_handoff(
+        self,
+        conn: Optional[asyncpg.Connection] = None
+    ) -> Optional[SelfPreservationHandoff]:
         """Load the most recent pending or in-progress handoff."""
-        query = """
-            SELECT handoff_id, restart_target, restart_reason,
-                   remediation_context, status, callback_url,
-                   n8n_execution_id, error_message, created_at, completed_at
-            FROM self_preservation_handoffs
-            WHERE status IN ('pending', 'in_progress')
-            ORDER BY created_at DESC
-            LIMIT 1
+        return await self._load_pending_or_by_id(None, conn)
+
+    async def _load_pending_or_by_id(
+        self,
+        handoff_id: Optional[str],
+        conn: Optional[asyncpg.Connection] = None
+    ) -> Optional[SelfPreservationHandoff]:
         """
+        Load a handoff by ID, or the latest pending/in_progress one if None.
 
-        async with self.db.pool.acquire() as conn:
-            row = await conn.fetchrow(query)
+        Both lookups share LOAD_HANDOFF_SQL: one acquire and one fetch, and
+        a single cached prepared statement per connection. Callers already
+        holding a connection pass it as conn to skip the pool acquire.
+        """
+        if conn is not None:
+            row = await conn.fetchrow(self.LOAD_HANDOFF_SQL, handoff_id)
+        else:
+            async with self.db.pool.acquire() as conn:
+                row = await conn.fetchrow(self.LOAD_HANDOFF_SQL, handoff_id)
 
-        if not row:
-            return None
+        return self._row_to_handoff(row) if row else None
 
-        context = None
-        if row['remediation_context']:
-            context_data = json.loads(row['remediation_context'])
-            context = RemediationContext.from_dict(context_data)
+    def _notify_in_background(self, notification: Awaitable[None], handoff_id: str) -> None:
+        """
+        Send a Discord notification without blocking the caller.
 
-        return SelfPreservationHandoff(
-            handoff_id=row['handoff_id'],
-            restart_target=SelfRestartTarget(row['restart_target']),
-            restart_reason=row['restart_reason'],
-            remediation_context=context,
-            status=HandoffStatus(row['status']),
-            callback_url=row['callback_url'],
-            n8n_execution_id=row['n8n_execution_id'],
-            error_message=row['error_message'],
-            created_at=row['created_at'],
-            completed_at=row['completed_at']
-        )
+        A slow or rate-limited webhook shouldn't hold up the restart flow;
+        failures are logged, as they were when the send was awaited inline.
+        """
+        async def _send() -> None:
+            try:
+                await notification
+            except Exception as e:
+                self.logger.warning(
+                    "discord_notification_failed",
+                    handoff_id=handoff_id,
+                    error=str(e)
+                )
+
+        task = asyncio.create_task(_send(), name=f"discord-notify-{handoff_id}")
+        self._pending_notifications.add(task)
+        task.add_done_callback(self._pending_notifications.discard)
 
     async def _trigger_n8n_restart_workflow(
         self,
@@ -868,8 +1108,8 @@ class SelfPreservationManager:
             "callback_url": handoff.callback_url,
             "jarvis_health_url": f"{self._jarvis_url}/health",
             "timeout_minutes": timeout_minutes,
-            "ssh_host": settings.ssh_management-host_host,
-            "ssh_user": settings.ssh_management-host_user
+            "ssh_host": self._ssh_host,
+            "ssh_user": self._ssh_user
         }
 
         self.logger.info(
@@ -888,46 +1128,36 @@ class SelfPreservationManager:
 
     async def _notify_self_restart_initiated(self, handoff: SelfPreservationHandoff) -> None:
         """Send Discord notification that self-restart is starting."""
-        message = f"""## Self-Restart Initiated
-
-**Handoff ID:** `{handoff.handoff_id}`
-**Target:** {handoff.restart_target.value}
-**Reason:** {handoff.restart_reason}
-**Time:** {handoff.created_at}
-
-Jarvis is handing off to n8n for restart orchestration.
-Will resume automatically after restart completes.
-
-{"**Remediation in progress will resume after restart.**" if handoff.remediation_context else ""}
-"""
+        message = _INITIATED_TEMPLATE.format(
+            handoff_id=handoff.handoff_id,
+            target=handoff.restart_target.value,
+            reason=handoff.restart_reason,
+            created_at=handoff.created_at,
+            resume_note=_INITIATED_RESUME_NOTE if handoff.remediation_context else ""
+        )
         await self.discord_notifier.send_webhook({
-            "username": "Jarvis - Self-Preservation",
+            "username": _NOTIFY_USERNAME,
             "content": message
         })
 
     async def _notify_self_restart_completed(self, handoff: SelfPreservationHandoff) -> None:
         """Send Discord notification that self-restart completed."""
         duration = ""
-        if handoff.created_at and handoff.completed_at:
-            try:
-                start = datetime.fromisoformat(handoff.created_at)
-                end = datetime.fromisoformat(handoff.completed_at)
-                duration = f"\n**Duration:** {int((end - start).total_seconds())} seconds"
-            except Exception:
-                pass
-
-        message = f"""## Self-Restart Completed
+        # created_at was parsed when the handoff was built; completed_at was
+        # just written by resume_from_handoff in the same ISO format
+        if handoff.created_at_dt is not None and handoff.completed_at:
+            seconds = int((_parse_iso(handoff.completed_at) - handoff.created_at_dt).total_seconds())
+            duration = f"\n**Duration:** {seconds} seconds"
 
-**Handoff ID:** `{handoff.handoff_id}`
-**Target:** {handoff.restart_target.value}
-**Status:** {handoff.status.value}{duration}
-
-Jarvis has successfully restarted and resumed operations.
-
-{"**Resuming previous remediation...**" if handoff.remediation_context else ""}
-"""
+        message = _COMPLETED_TEMPLATE.format(
+            handoff_id=handoff.handoff_id,
+            target=handoff.restart_target.value,
+            status=handoff.status.value,
+            duration=duration,
+            resume_note=_COMPLETED_RESUME_NOTE if handoff.remediation_context else ""
+        )
         await self.discord_notifier.send_webhook({
-            "username": "Jarvis - Self-Preservation",
+            "username": _NOTIFY_USERNAME,
             "content": message
         })
 
@@ -5,17 +5,32 @@ Uses asyncssh for non-blocking SSH operations.
 
 import asyncio
 import asyncssh
+import ahocorasick
+import contextlib
+import functools
 import os
+import random
 import re
+import secrets
+import shlex
 import stat
 import structlog
-from typing import List, Tuple, Optional
-from datetime import datetime
+import time
+from collections import defaultdict
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, List, Mapping, NamedTuple, Set, Tuple, Optional, Union
 from .config import settings
 from .models import HostType, SSHExecutionResult
 
 logger = structlog.get_logger()
 
+# HIGH-009 FIX: Whether Jarvis runs in a container (checked once, not per command)
+IN_DOCKER = os.path.exists('/.dockerenv')
+
+# Characters /bin/sh would interpret (quoting, expansion, redirection,
+# assignment, ...); local commands without any of them are run without a shell
+_SHELL_META_CHARS = frozenset('|&;<>()$`\\"\'*?[]#~={}!\n\r')
+
 
 # SECURITY-003 FIX: Patterns that indicate potential command injection
 # Note: We allow 2>&1 (stderr redirect) as it's safe and commonly used
@@ -59,8 +74,36 @@ SAFE_PIPE_PATTERNS = [
     (r'rclone\s+lsf', r'head'),             # rclone lsf | head
 ]
 
-# Compiled pattern for efficiency
+# Compiled patterns for efficiency
 DANGEROUS_PATTERN_RE = re.compile('|'.join(DANGEROUS_COMMAND_PATTERNS))
+# Prefilter: a command with none of these characters or keywords cannot match
+# COMMAND_CHECK_RE (or need the pipe check), so the regex scan is skipped
+_DANGER_CHARS = frozenset(';&`$|<>\n\r')
+_DANGER_WORDS = ('eval', 'source', 'exec')
+
+# Newlines plus the dangerous patterns in one alternation, so a clean command
+# is scanned once; lastgroup tells which kind matched first
+COMMAND_CHECK_RE = re.compile(
+    r'(?P<newline>[\n\r])|(?P<dangerous>' + '|'.join(DANGEROUS_COMMAND_PATTERNS) + ')'
+)
+SAFE_PIPE_PATTERNS_RE = [
+    (re.compile(left, re.IGNORECASE), re.compile(right, re.IGNORECASE))
+    for left, right in SAFE_PIPE_PATTERNS
+]
+
+
+def _strip_bounds(command: str, lo: int, hi: int) -> Tuple[int, int]:
+    """
+    Bounds of command[lo:hi] with surrounding whitespace trimmed, without copying.
+
+    A linear scan from each end; a backtracking regex such as \\s*\\Z
+    would be quadratic in the length of a whitespace run.
+    """
+    while lo < hi and command[lo].isspace():
+        lo += 1
+    while hi > lo and command[hi - 1].isspace():
+        hi -= 1
+    return lo, hi
 
 
 def _is_safe_pipe_command(command: str) -> bool:
@@ -76,26 +119,60 @@ def _is_safe_pipe_command(command: str) -> bool:
     if '|' not in command:
         return True
 
-    # Split on pipes and check each pair
-    parts = command.split('|')
-    for i in range(len(parts) - 1):
-        left = parts[i].strip()
-        right = parts[i + 1].strip()
+    # Walk the pipe positions and match each pair within index bounds
+    # (trimmed of surrounding whitespace) rather than splitting and
+    # stripping copies of every segment
+    end = len(command)
+    left_start = 0
+    pipe = command.find('|')
+    while pipe != -1:
+        next_pipe = command.find('|', pipe + 1)
+        right_end = end if next_pipe == -1 else next_pipe
+
+        left_lo, left_hi = _strip_bounds(command, left_start, pipe)
+        right_lo, right_hi = _strip_bounds(command, pipe + 1, right_end)
 
         # Check if this pipe matches any safe pattern
         is_safe_pair = False
-        for left_pattern, right_pattern in SAFE_PIPE_PATTERNS:
-            if re.search(left_pattern, left, re.IGNORECASE) and \
-               re.match(right_pattern, right, re.IGNORECASE):
+        for left_re, right_re in SAFE_PIPE_PATTERNS_RE:
+            if (
+                left_re.search(command, left_lo, left_hi)
+                and right_re.match(command, right_lo, right_hi)
+            ):
                 is_safe_pair = True
                 break
 
         if not is_safe_pair:
             return False
 
+        left_start = pipe + 1
+        pipe = next_pipe
+
     return True
 
 
+# HIGH-002 FIX: Substrings marking a diagnostic/read-only command, whose
+# failure shouldn't stop a batch (matched against the lowercased command)
+DIAGNOSTIC_COMMAND_PATTERNS = (
+    'status', 'ps ', 'ps|', 'logs ', 'journalctl', 'systemctl is-active',
+    'docker inspect', 'docker ps', 'cat ', 'head ', 'tail ', 'grep ',
+    'ls ', 'df ', 'du ', 'free', 'uptime', 'top -b', 'netstat', 'ss ',
+    'find ', 'which ', 'whereis ', 'file ', 'stat '
+)
+
+
+def _build_diagnostic_automaton() -> ahocorasick.Automaton:
+    """Aho-Corasick automaton over DIAGNOSTIC_COMMAND_PATTERNS (one pass per command)."""
+    automaton = ahocorasick.Automaton()
+    for pattern in DIAGNOSTIC_COMMAND_PATTERNS:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return automaton
+
+
+DIAGNOSTIC_AUTOMATON = _build_diagnostic_automaton()
+
+
 # Safe patterns for Dockerfile operations (when allow_dockerfile_ops=True)
 SAFE_DOCKERFILE_PATTERNS = [
     r'^cat\s+>\s+[^\s|;]+Dockerfile\s+<<',  # Heredoc write to Dockerfile
@@ -130,15 +207,26 @@ def validate_command_safety(
             if re.match(pattern, command, re.IGNORECASE):
                 return True, None
 
-    # Check for dangerous patterns first
-    if DANGEROUS_PATTERN_RE.search(command):
-        match = DANGEROUS_PATTERN_RE.search(command)
-        return False, f"Dangerous pattern detected: '{match.group()}'"
+    # Fast path: the common plain command has no metacharacters at all
+    if _DANGER_CHARS.isdisjoint(command) and not any(word in command for word in _DANGER_WORDS):
+        return True, None
+
+    # Check for dangerous patterns and newlines in a single scan
+    match = COMMAND_CHECK_RE.search(command)
+    if match:
+        if match.lastgroup == 'dangerous':
+            return False, f"Dangerous pattern detected: '{match.group()}'"
 
-    # Check for newlines (could be used to inject commands)
-    # But allow newlines in heredocs (Dockerfile writes)
-    if ('\n' in command or '\r' in command) and '<<' not in command:
-        return False, "Newline characters not allowed in commands"
+        # Hit a newline first: dangerous patterns later in the command still
+        # take precedence
+        dangerous = DANGEROUS_PATTERN_RE.search(command, match.end())
+        if dangerous:
+            return False, f"Dangerous pattern detected: '{dangerous.group()}'"
+
+        # Check for newlines (could be used to inject commands)
+        # But allow newlines in heredocs (Dockerfile writes)
+        if '<<' not in command:
+            return False, "Newline characters not allowed in commands"
 
     # Check pipe commands against safe patterns
     if '|' in command and not _is_safe_pipe_command(command):
@@ -147,50 +235,85 @@ def validate_command_safety(
     return True, None
 
 
+class HostConfig(NamedTuple):
+    """SSH connection settings for one host."""
+    host: str
+    username: str
+    client_keys: Tuple[str, ...]
+    # Commands run in a local subprocess instead of over SSH (Outpost or
+    # Skynet configured as localhost, i.e. where Jarvis itself runs)
+    is_local: bool = False
+
+
+@functools.cache
+def _build_host_config() -> Mapping[HostType, HostConfig]:
+    """Build the host configuration mapping from settings (once per process)."""
+    return MappingProxyType({
+        HostType.NEXUS: HostConfig(
+            host=settings.ssh_nexus_host,
+            username=settings.ssh_nexus_user,
+            client_keys=(settings.ssh_nexus_key_path,),
+        ),
+        HostType.HOMEASSISTANT: HostConfig(
+            host=settings.ssh_homeassistant_host,
+            username=settings.ssh_homeassistant_user,
+            client_keys=(settings.ssh_homeassistant_key_path,),
+        ),
+        HostType.OUTPOST: HostConfig(
+            host=settings.ssh_outpost_host,
+            username=settings.ssh_outpost_user,
+            client_keys=(settings.ssh_outpost_key_path,),
+            is_local=settings.ssh_outpost_host == "localhost",
+        ),
+        HostType.SKYNET: HostConfig(
+            host=settings.ssh_skynet_host,
+            username=settings.ssh_skynet_user,
+            client_keys=(settings.ssh_skynet_key_path,),
+            is_local=settings.ssh_skynet_host == "localhost",
+        ),
+    })
+
+
 class SSHExecutor:
     """Executes commands on remote systems via SSH."""
 
     def __init__(self, host_monitor=None):
         """Initialize SSH executor."""
         self.logger = logger.bind(component="ssh_executor")
-        self._connections = {}
+        # Per-host pool of open connections, oldest first; each connection
+        # multiplexes several concurrent channels
+        self._connections: Dict[HostType, List[asyncssh.SSHClientConnection]] = defaultdict(list)
+        self._sessions: Dict[asyncssh.SSHClientConnection, int] = {}  # Open channels per connection
+        self._host_slots: Dict[HostType, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.MAX_CONNECTIONS_PER_HOST * self.MAX_SESSIONS_PER_CONNECTION)
+        )
+        self._conn_locks: Dict[HostType, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._reapers: Set[asyncio.Task] = set()  # Strong refs to close watchers
+        self._last_used: Dict[asyncssh.SSHClientConnection, float] = {}
+        self._idle_reaper: Optional[asyncio.Task] = None
         self.host_monitor = host_monitor  # Optional host monitor for tracking
         self._keys_validated = False
+        self._key_validation_results: dict = {}
 
         # Host configuration mapping
-        self.host_config = {
-            HostType.NEXUS: {
-                "host": settings.ssh_nexus_host,
-                "username": settings.ssh_nexus_user,
-                "client_keys": [settings.ssh_nexus_key_path],
-            },
-            HostType.HOMEASSISTANT: {
-                "host": settings.ssh_homeassistant_host,
-                "username": settings.ssh_homeassistant_user,
-                "client_keys": [settings.ssh_homeassistant_key_path],
-            },
-            HostType.OUTPOST: {
-                "host": settings.ssh_outpost_host,
-                "username": settings.ssh_outpost_user,
-                "client_keys": [settings.ssh_outpost_key_path],
-            },
-            HostType.SKYNET: {
-                "host": settings.ssh_skynet_host,
-                "username": settings.ssh_skynet_user,
-                "client_keys": [settings.ssh_skynet_key_path],
-            },
-        }
-
-    def validate_ssh_keys(self) -> dict:
+        self.host_config = _build_host_config()
+
+    def validate_ssh_keys(self, refresh: bool = False) -> dict:
         """
         Validate SSH keys exist and have correct permissions.
 
         CRITICAL-003 FIX: Validates SSH key files on startup to fail fast with clear
         error messages instead of cryptic SSH authentication failures.
 
+        Args:
+            refresh: Re-check the key files instead of returning the cached results
+
         Returns:
             Dict with validation results for each host
         """
+        if self._keys_validated and not refresh:
+            return self._key_validation_results
+
         results = {}
         seen_keys = set()
 
@@ -198,18 +321,20 @@ class SSHExecutor:
             host_name = host_type.value
 
             # Skip localhost hosts (don't need SSH keys)
-            if config["host"] == "localhost":
+            if config.host == "localhost":
                 results[host_name] = {"status": "skipped", "reason": "localhost"}
                 continue
 
-            for key_path in config["client_keys"]:
+            for key_path in config.client_keys:
                 # Skip if we already checked this key
                 if key_path in seen_keys:
                     continue
                 seen_keys.add(key_path)
 
-                # Check if file exists
-                if not os.path.exists(key_path):
+                # One stat covers both existence and permissions
+                try:
+                    file_stat = os.stat(key_path)
+                except FileNotFoundError:
                     results[host_name] = {
                         "status": "error",
                         "key_path": key_path,
@@ -221,38 +346,6 @@ class SSHExecutor:
                         key_path=key_path
                     )
                     continue
-
-                # Check file permissions
-                try:
-                    file_stat = os.stat(key_path)
-                    mode = file_stat.st_mode & 0o777
-
-                    if mode != 0o600:
-                        results[host_name] = {
-                            "status": "error",
-                            "key_path": key_path,
-                            "permissions": oct(mode),
-                            "error": f"SSH key has insecure permissions {oct(mode)}, must be 0o600. "
-                                     f"Fix with: chmod 600 {key_path}"
-                        }
-                        self.logger.error(
-                            "ssh_key_permissions_invalid",
-                            host=host_name,
-                            key_path=key_path,
-                            actual_mode=oct(mode),
-                            required_mode="0o600"
-                        )
-                    else:
-                        results[host_name] = {
-                            "status": "ok",
-                            "key_path": key_path,
-                            "permissions": oct(mode)
-                        }
-                        self.logger.info(
-                            "ssh_key_validated",
-                            host=host_name,
-                            key_path=key_path
-                        )
                 except OSError as e:
                     results[host_name] = {
                         "status": "error",
@@ -265,7 +358,39 @@ class SSHExecutor:
                         key_path=key_path,
                         error=str(e)
                     )
+                    continue
 
+                # Check file permissions
+                mode = file_stat.st_mode & 0o777
+
+                if mode != 0o600:
+                    results[host_name] = {
+                        "status": "error",
+                        "key_path": key_path,
+                        "permissions": oct(mode),
+                        "error": f"SSH key has insecure permissions {oct(mode)}, must be 0o600. "
+                                 f"Fix with: chmod 600 {key_path}"
+                    }
+                    self.logger.error(
+                        "ssh_key_permissions_invalid",
+                        host=host_name,
+                        key_path=key_path,
+                        actual_mode=oct(mode),
+                        required_mode="0o600"
+                    )
+                else:
+                    results[host_name] = {
+                        "status": "ok",
+                        "key_path": key_path,
+                        "permissions": oct(mode)
+                    }
+                    self.logger.info(
+                        "ssh_key_validated",
+                        host=host_name,
+                        key_path=key_path
+                    )
+
+        self._key_validation_results = results
         self._keys_validated = True
         return results
 
@@ -285,10 +410,71 @@ class SSHExecutor:
 
         return errors
 
+    # Connection pool sizing: channels per connection stay below OpenSSH's
+    # default MaxSessions (10); extra connections open only under load
+    MAX_CONNECTIONS_PER_HOST = 4
+    MAX_SESSIONS_PER_CONNECTION = 8
+
+    def _pick_connection(self, host: HostType) -> Optional[asyncssh.SSHClientConnection]:
+        """
+        Choose a pooled connection for a new channel.
+
+        Fills the oldest connection with a free session first, so connections
+        opened for a burst go idle afterwards and are closed by the idle
+        reaper. Returns None when another connection should be opened.
+        """
+        pool = self._connections.get(host)
+        if not pool:
+            return None
+        for conn in pool:
+            if self._sessions.get(conn, 0) < self.MAX_SESSIONS_PER_CONNECTION:
+                return conn
+        if len(pool) >= self.MAX_CONNECTIONS_PER_HOST:
+            return min(pool, key=lambda c: self._sessions.get(c, 0))
+        return None
+
+    # Connections idle this long get a cheap probe before reuse (seconds)
+    PROBE_AFTER_IDLE = 60
+    PROBE_TIMEOUT = 2.0
+
+    async def _pick_live_connection(self, host: HostType) -> Optional[asyncssh.SSHClientConnection]:
+        """
+        _pick_connection, probing a connection first if it has sat idle.
+
+        Keepalives close dead connections eventually; the probe catches one
+        that died since the last keepalive, so the next command doesn't pay
+        for it with a failure and a retry.
+        """
+        while True:
+            conn = self._pick_connection(host)
+            if (
+                conn is None
+                or conn in self._sessions
+                or time.monotonic() - self._last_used.get(conn, 0.0) < self.PROBE_AFTER_IDLE
+            ):
+                return conn
+
+            try:
+                async with asyncio.timeout(self.PROBE_TIMEOUT):
+                    await conn.run("true", check=False)
+            except Exception as e:
+                self.logger.info(
+                    "ssh_connection_probe_failed",
+                    host=host.value,
+                    error=str(e)
+                )
+                self._discard_connection(host, conn)
+                conn.close()
+                continue
+
+            self._last_used[conn] = time.monotonic()
+            return conn
+
     async def _get_connection(self, host: HostType) -> asyncssh.SSHClientConnection:
         """
         Get or create SSH connection to a host.
-        Reuses existing connections when available.
+        Reuses pooled connections when they have a free session, and opens
+        another (up to MAX_CONNECTIONS_PER_HOST) when they are all busy.
 
         Args:
             host: Target host type
@@ -297,85 +483,193 @@ class SSHExecutor:
             SSH connection object
         """
         # For localhost (Outpost or Skynet when running locally), use subprocess instead
-        if host == HostType.OUTPOST and settings.ssh_outpost_host == "localhost":
+        if self.host_config[host].is_local:
             # Return None to signal we should use subprocess instead
             return None
-        if host == HostType.SKYNET and settings.ssh_skynet_host == "localhost":
-            # Skynet is where Jarvis runs - execute locally
-            return None
 
-        # Check if we have an existing connection that's still alive
-        if host in self._connections:
-            conn = self._connections[host]
-            if not conn.is_closed():
-                self.logger.debug(
-                    "reusing_ssh_connection",
-                    host=host.value
-                )
+        # Pooled connections are dropped by _reap_on_close when they close,
+        # so presence in the pool means the connection is alive
+        conn = await self._pick_live_connection(host)
+        if conn is not None:
+            self.logger.debug(
+                "reusing_ssh_connection",
+                host=host.value
+            )
+            return conn
+
+        # One handshake at a time per host: concurrent callers wait for it
+        # and then share the new connection's sessions
+        async with self._conn_locks[host]:
+            conn = await self._pick_live_connection(host)
+            if conn is not None:
                 return conn
-            else:
-                # Connection is closed, remove it
-                del self._connections[host]
 
-        config = self.host_config[host]
+            config = self.host_config[host]
 
-        try:
-            conn = await asyncio.wait_for(
-                asyncssh.connect(
-                    host=config["host"],
-                    username=config["username"],
-                    client_keys=config["client_keys"],
-                    known_hosts=None,  # Accept any host key (homelab environment)
-                ),
-                timeout=settings.ssh_connection_timeout
-            )
+            try:
+                # asyncio.timeout cancels the connect in place instead of
+                # wrapping it in another task as wait_for does
+                async with asyncio.timeout(settings.ssh_connection_timeout):
+                    conn = await asyncssh.connect(
+                        host=config.host,
+                        username=config.username,
+                        client_keys=list(config.client_keys),
+                        known_hosts=None,  # Accept any host key (homelab environment)
+                        # Detect silently dead peers (NAT rebinding, reboot) so
+                        # the connection closes and leaves the pool
+                        keepalive_interval=settings.ssh_keepalive_interval,
+                        keepalive_count_max=settings.ssh_keepalive_count_max,
+                    )
 
-            # Store connection for reuse
-            self._connections[host] = conn
+                # Pool connection for reuse until it closes
+                self._connections[host].append(conn)
+                reaper = asyncio.create_task(self._reap_on_close(host, conn))
+                self._reapers.add(reaper)
+                reaper.add_done_callback(self._reapers.discard)
+                self._last_used[conn] = time.monotonic()
+                if settings.ssh_idle_timeout > 0 and (
+                    self._idle_reaper is None or self._idle_reaper.done()
+                ):
+                    self._idle_reaper = asyncio.create_task(self._close_idle_connections())
 
-            self.logger.info(
-                "ssh_connection_established",
-                host=host.value,
-                remote_host=config["host"]
-            )
-
-            # Record successful connection
-            if self.host_monitor:
-                await self.host_monitor.record_connection_attempt(
-                    host.value,
-                    success=True
+                self.logger.info(
+                    "ssh_connection_established",
+                    host=host.value,
+                    remote_host=config.host,
+                    pool_size=len(self._connections[host])
                 )
 
-            return conn
+                # Record successful connection
+                if self.host_monitor:
+                    await self.host_monitor.record_connection_attempt(
+                        host.value,
+                        success=True
+                    )
 
-        except asyncio.TimeoutError:
-            self.logger.error(
-                "ssh_connection_timeout",
-                host=host.value,
-                timeout=settings.ssh_connection_timeout
-            )
-            # Record failed connection
-            if self.host_monitor:
-                await self.host_monitor.record_connection_attempt(
-                    host.value,
-                    success=False,
-                    error_message=f"Connection timeout after {settings.ssh_connection_timeout}s"
+                return conn
+
+            except asyncio.TimeoutError:
+                self.logger.error(
+                    "ssh_connection_timeout",
+                    host=host.value,
+                    timeout=settings.ssh_connection_timeout
                 )
-            raise
-        except Exception as e:
-            self.logger.error(
-                "ssh_connection_failed",
-                host=host.value,
-                error=str(e)
-            )
-            # Record failed connection
-            if self.host_monitor:
-                await self.host_monitor.record_connection_attempt(
-                    host.value,
-                    success=False,
-                    error_message=str(e)
+                # Record failed connection
+                if self.host_monitor:
+                    await self.host_monitor.record_connection_attempt(
+                        host.value,
+                        success=False,
+                        error_message=f"Connection timeout after {settings.ssh_connection_timeout}s"
+                    )
+                raise
+            except Exception as e:
+                self.logger.error(
+                    "ssh_connection_failed",
+                    host=host.value,
+                    error=str(e)
                 )
+                # Record failed connection
+                if self.host_monitor:
+                    await self.host_monitor.record_connection_attempt(
+                        host.value,
+                        success=False,
+                        error_message=str(e)
+                    )
+                raise
+
+    # How often cached connections are checked for idleness (seconds)
+    IDLE_CHECK_INTERVAL = 60
+
+    # Retry backoff for connection errors: base/cap in seconds, jitter as a
+    # fraction of the delay
+    RETRY_BACKOFF_BASE = 1.0
+    RETRY_BACKOFF_CAP = 30.0
+    RETRY_BACKOFF_JITTER = 0.5
+
+    @staticmethod
+    def _retry_delay(attempt: int, base_delay: float, max_delay: float, jitter: float) -> float:
+        """Capped exponential backoff for a retry, stretched by random jitter."""
+        return min(max_delay, base_delay * (2 ** attempt)) * (1 + random.random() * jitter)
+
+    async def _reap_on_close(
+        self,
+        host: HostType,
+        conn: asyncssh.SSHClientConnection
+    ) -> None:
+        """Drop a pooled connection as soon as it closes (remote or local)."""
+        await conn.wait_closed()
+        self._last_used.pop(conn, None)
+        # It may already have been removed (stale or idle close)
+        if self._discard_connection(host, conn):
+            self.logger.debug(
+                "ssh_connection_reaped",
+                host=host.value
+            )
+
+    def _discard_connection(self, host: HostType, conn: asyncssh.SSHClientConnection) -> bool:
+        """Remove a connection from the host's pool; False if it wasn't pooled."""
+        pool = self._connections.get(host)
+        if pool and conn in pool:
+            pool.remove(conn)
+            return True
+        return False
+
+    async def _close_idle_connections(self) -> None:
+        """Periodically close pooled connections unused for ssh_idle_timeout."""
+        while True:
+            await asyncio.sleep(self.IDLE_CHECK_INTERVAL)
+            cutoff = time.monotonic() - settings.ssh_idle_timeout
+            for host, pool in self._connections.items():
+                idle = [
+                    conn for conn in pool
+                    if conn not in self._sessions and self._last_used.get(conn, 0.0) < cutoff
+                ]
+                for conn in idle:
+                    pool.remove(conn)
+                    self._last_used.pop(conn, None)
+                    conn.close()
+                    self.logger.info(
+                        "ssh_connection_idle_closed",
+                        host=host.value,
+                        idle_timeout=settings.ssh_idle_timeout
+                    )
+
+    async def _checkout(self, host: HostType) -> asyncssh.SSHClientConnection:
+        """
+        Reserve a channel on a pooled connection; pair with _checkin.
+
+        Waits when every connection the host may have is at its session
+        limit, rather than opening channels the server would refuse.
+        """
+        slots = self._host_slots[host]
+        await slots.acquire()
+        try:
+            conn = await self._get_connection(host)
+        except BaseException:
+            slots.release()
             raise
+        self._sessions[conn] = self._sessions.get(conn, 0) + 1
+        return conn
+
+    def _checkin(self, host: HostType, conn: asyncssh.SSHClientConnection) -> None:
+        """Release a channel reserved by _checkout."""
+        remaining = self._sessions.get(conn, 1) - 1
+        if remaining:
+            self._sessions[conn] = remaining
+        else:
+            self._sessions.pop(conn, None)
+        if conn in self._connections.get(host, ()):
+            self._last_used[conn] = time.monotonic()
+        self._host_slots[host].release()
+
+    @contextlib.asynccontextmanager
+    async def _acquire(self, host: HostType) -> AsyncIterator[asyncssh.SSHClientConnection]:
+        """Context manager around _checkout/_checkin for one channel."""
+        conn = await self._checkout(host)
+        try:
+            yield conn
+        finally:
+            self._checkin(host, conn)
 
     async def execute_command(
         self,
@@ -383,13 +677,21 @@ class SSHExecutor:
         command: str,
         timeout: Optional[int] = None,
         max_retries: int = 3,
-        allow_dockerfile_ops: bool = False
+        allow_dockerfile_ops: bool = False,
+        base_delay: float = RETRY_BACKOFF_BASE,
+        max_delay: float = RETRY_BACKOFF_CAP,
+        jitter: float = RETRY_BACKOFF_JITTER,
+        retry_on_timeout: bool = False
     ) -> Tuple[str, str, int]:
         """
         Execute a single command on a remote host with retry logic.
 
-        Retries on connection errors only (not command failures).
-        Uses exponential backoff: 2s, 4s, 8s.
+        Retries on connection errors only (not command failures), and on
+        command timeouts only when retry_on_timeout is set.
+        Uses capped exponential backoff with jitter (1s, 2s, 4s ... up to
+        30s, each stretched by up to 50%) so alerts failing together don't
+        retry in lockstep and queue up on sshd's MaxStartups.
+        Cancellation aborts the retry loop instead of starting another attempt.
 
         SECURITY-003 FIX: Validates command against dangerous patterns before execution.
 
@@ -399,10 +701,30 @@ class SSHExecutor:
             timeout: Execution timeout in seconds
             max_retries: Maximum retry attempts on connection errors
             allow_dockerfile_ops: If True, allow safe Dockerfile modification patterns
+            base_delay: Backoff before the first retry, in seconds
+            max_delay: Upper bound on the backoff, in seconds (before jitter)
+            jitter: Random stretch of each delay, as a fraction of it
+            retry_on_timeout: Also retry when the command times out (only for
+                commands that are safe to repeat, e.g. read-only ones)
 
         Returns:
             Tuple of (stdout, stderr, exit_code)
         """
+        # Encode once: the byte length is what the limit guards, and the
+        # same bytes are handed to asyncssh for the remote exec request.
+        # Checked before validation so the safety regexes only ever scan
+        # bounded input
+        command_bytes = command.encode('utf-8')
+        if len(command_bytes) > self.MAX_COMMAND_LENGTH:
+            self.logger.error(
+                "command_too_long",
+                host=host.value,
+                command_length=len(command_bytes),
+                max_length=self.MAX_COMMAND_LENGTH,
+                command_preview=command[:100] + "..."
+            )
+            return "", f"Command exceeds maximum length of {self.MAX_COMMAND_LENGTH} bytes", -1
+
         # SECURITY-003 FIX: Validate command safety before execution
         is_safe, reason = validate_command_safety(command, allow_dockerfile_ops)
         if not is_safe:
@@ -417,8 +739,11 @@ class SSHExecutor:
         timeout = timeout or settings.command_execution_timeout
 
         for attempt in range(max_retries):
+            conn = None
             try:
-                self.logger.info(
+                # Only retries are worth an INFO line up front; a normal run is
+                # logged once, with its command, when it completes
+                (self.logger.info if attempt > 0 else self.logger.debug)(
                     "executing_command",
                     host=host.value,
                     command=command,
@@ -427,28 +752,25 @@ class SSHExecutor:
                 )
 
                 # Handle local execution (Outpost or Skynet)
-                if host == HostType.OUTPOST and settings.ssh_outpost_host == "localhost":
-                    return await self._execute_local(command, timeout)
-                if host == HostType.SKYNET and settings.ssh_skynet_host == "localhost":
-                    return await self._execute_local(command, timeout)
-
-                # Remote execution via SSH
-                conn = await self._get_connection(host)
-
-                result = await asyncio.wait_for(
-                    conn.run(command, check=False),
-                    timeout=timeout
-                )
+                if self._is_local(host):
+                    stdout, stderr, exit_code = await self._execute_local(command, timeout)
+                else:
+                    # Remote execution via SSH, on a channel of a pooled connection
+                    async with self._acquire(host) as conn:
+                        async with asyncio.timeout(timeout):
+                            stdout, stderr, exit_code = await self._run_capped(conn, command_bytes)
 
-                stdout = result.stdout.strip() if result.stdout else ""
-                stderr = result.stderr.strip() if result.stderr else ""
-                exit_code = result.exit_status
+                    # Callers compare trimmed output (e.g. "active"), so keep strip();
+                    # it only copies when there is whitespace to remove
+                    stdout = stdout.strip()
+                    stderr = stderr.strip()
 
-                # Don't close connection - keep it open for reuse
+                    # Don't close connection - keep it open for reuse
 
                 self.logger.info(
                     "command_executed",
                     host=host.value,
+                    command=command,
                     exit_code=exit_code,
                     stdout_length=len(stdout),
                     stderr_length=len(stderr)
@@ -457,7 +779,20 @@ class SSHExecutor:
                 return stdout, stderr, exit_code
 
             except asyncio.TimeoutError:
-                # Command timeout is not retryable (it's a command issue, not connection)
+                # Command timeout is not retryable by default (it's a command
+                # issue, not connection); idempotent callers may opt in
+                if retry_on_timeout and attempt < max_retries - 1:
+                    self.logger.warning(
+                        "command_timeout_retry",
+                        host=host.value,
+                        command=command,
+                        timeout=timeout,
+                        attempt=attempt + 1,
+                        max_retries=max_retries
+                    )
+                    await asyncio.sleep(self._retry_delay(attempt, base_delay, max_delay, jitter))
+                    continue
+
                 self.logger.error(
                     "command_timeout",
                     host=host.value,
@@ -483,9 +818,9 @@ class SSHExecutor:
                     return "", f"SSH connection failed after {max_retries} attempts: {str(e)}", -1
 
                 # Close stale connection before retry
-                if host in self._connections:
+                if conn is not None and self._discard_connection(host, conn):
                     try:
-                        self._connections[host].close()
+                        conn.close()
                         self.logger.debug(
                             "stale_connection_closed",
                             host=host.value
@@ -497,11 +832,17 @@ class SSHExecutor:
                             host=host.value,
                             error=str(cleanup_error)
                         )
-                    del self._connections[host]
 
-                # Exponential backoff: 2s, 4s, 8s
-                delay = 2 ** (attempt + 1)
-                await asyncio.sleep(delay)
+                await asyncio.sleep(self._retry_delay(attempt, base_delay, max_delay, jitter))
+
+            except asyncio.CancelledError:
+                # Caller gave up (e.g. request cancelled) - don't retry
+                self.logger.info(
+                    "command_cancelled",
+                    host=host.value,
+                    attempt=attempt + 1
+                )
+                raise
 
             except Exception as e:
                 # Other errors (non-connection) - don't retry
@@ -524,6 +865,9 @@ class SSHExecutor:
         """
         Execute command locally using subprocess.
 
+        Only used when the host is configured as "localhost"; remote hosts
+        always go through the asyncssh pool, never an ssh subprocess.
+
         HIGH-009 FIX: Handles sudo commands when running in Docker container.
         Since container runs as root, sudo is unnecessary and may not exist.
 
@@ -537,19 +881,35 @@ class SSHExecutor:
         try:
             # HIGH-009 FIX: Strip sudo from commands when running in container
             # Container typically runs as root, and sudo may not be installed
-            if os.path.exists('/.dockerenv'):
-                if command.strip().startswith('sudo '):
+            if IN_DOCKER:
+                if command.lstrip().startswith('sudo '):
                     command = command.replace('sudo ', '', 1)
                     self.logger.debug(
                         "stripped_sudo_in_container",
                         original_had_sudo=True
                     )
 
-            proc = await asyncio.create_subprocess_shell(
-                command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+            # Plain "program arg ..." commands are exec'd directly, skipping
+            # the /bin/sh fork; anything the shell must interpret (or a
+            # builtin/missing program) still goes through the shell
+            proc = None
+            argv = command.split()
+            if argv and _SHELL_META_CHARS.isdisjoint(command):
+                try:
+                    proc = await asyncio.create_subprocess_exec(
+                        *argv,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE
+                    )
+                except OSError:
+                    proc = None
+
+            if proc is None:
+                proc = await asyncio.create_subprocess_shell(
+                    command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
 
             stdout_bytes, stderr_bytes = await asyncio.wait_for(
                 proc.communicate(),
@@ -570,7 +930,9 @@ class SSHExecutor:
         except Exception as e:
             return "", str(e), -1
 
-    def _is_diagnostic_command(self, command: str) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _is_diagnostic_command(command: str) -> bool:
         """
         Check if a command is a diagnostic/read-only command.
 
@@ -584,24 +946,359 @@ class SSHExecutor:
         Returns:
             True if command is diagnostic (continue on failure)
         """
-        diagnostic_patterns = [
-            'status', 'ps ', 'ps|', 'logs ', 'journalctl', 'systemctl is-active',
-            'docker inspect', 'docker ps', 'cat ', 'head ', 'tail ', 'grep ',
-            'ls ', 'df ', 'du ', 'free', 'uptime', 'top -b', 'netstat', 'ss ',
-            'find ', 'which ', 'whereis ', 'file ', 'stat '
-        ]
-        cmd_lower = command.lower()
-        return any(pattern in cmd_lower for pattern in diagnostic_patterns)
+        # Commands are nearly always lowercase already; islower() scans without
+        # allocating, so only mixed-case commands pay for a lowered copy
+        if not command.islower():
+            command = command.lower()
+        return next(DIAGNOSTIC_AUTOMATON.iter(command), None) is not None
 
-    # MEDIUM-003 FIX: Maximum command length to prevent injection/overflow
+    # MEDIUM-003 FIX: Maximum command length (UTF-8 bytes) to prevent injection/overflow
     MAX_COMMAND_LENGTH = 10000
 
+    # Maximum stdout/stderr kept per command (characters); the rest is read
+    # and discarded so the remote command isn't stalled on a full window
+    MAX_OUTPUT_LENGTH = 1 << 20
+    OUTPUT_READ_CHUNK = 1 << 16
+
+    @classmethod
+    async def _read_capped(
+        cls,
+        stream: asyncssh.SSHReader,
+        limit: int,
+        chunks: Optional[List[str]] = None
+    ) -> str:
+        """
+        Read a stream to EOF, keeping at most limit characters.
+
+        If chunks is given, kept output is appended to it as it arrives, so
+        the caller still has what was read if the read is cancelled.
+        """
+        if chunks is None:
+            chunks = []
+        size = 0
+        while True:
+            chunk = await stream.read(cls.OUTPUT_READ_CHUNK)
+            if not chunk:
+                break
+            if size < limit:
+                chunks.append(chunk[:limit - size])
+            size += len(chunk)
+
+        output = "".join(chunks)
+        if size > limit:
+            output += f"\n... [output truncated: {size - limit} more characters]"
+        return output
+
+    async def _run_capped(
+        self,
+        conn: asyncssh.SSHClientConnection,
+        command: Union[str, bytes],
+        limit: Optional[int] = None,
+        stdout_chunks: Optional[List[str]] = None,
+        stderr_chunks: Optional[List[str]] = None
+    ) -> Tuple[str, str, Optional[int]]:
+        """
+        Run a command over SSH with bounded stdout/stderr capture.
+
+        stdout_chunks/stderr_chunks collect output as it is read (see
+        _read_capped), for callers that need partial output on timeout.
+
+        Returns:
+            Tuple of (stdout, stderr, exit_status), outputs unstripped
+        """
+        limit = limit or self.MAX_OUTPUT_LENGTH
+        async with conn.create_process(command) as proc:
+            stdout, stderr = await asyncio.gather(
+                self._read_capped(proc.stdout, limit, stdout_chunks),
+                self._read_capped(proc.stderr, limit, stderr_chunks)
+            )
+            await proc.wait()
+        return stdout, stderr, proc.exit_status
+
+    @staticmethod
+    def _command_size(command: str) -> int:
+        """UTF-8 size of a command; ASCII commands (the norm) skip the encode."""
+        return len(command) if command.isascii() else len(command.encode('utf-8'))
+
+    # Commands (UTF-8 bytes, excluding marker overhead) fused into one script
+    MAX_FUSED_LENGTH = 8192
+    # Upper bound on a fused script's total timeout (seconds); a single
+    # command's own timeout is always allowed even if it is longer
+    MAX_FUSED_TIMEOUT = 300
+
+    def _is_local(self, host: HostType) -> bool:
+        """Whether commands for this host run locally instead of over SSH."""
+        return self.host_config[host].is_local
+
+    def _fusable_run_length(
+        self,
+        host: HostType,
+        commands: List[str],
+        start: int,
+        allow_dockerfile_ops: bool
+    ) -> int:
+        """
+        Count consecutive commands from start that can share one SSH channel.
+
+        Only remote, single-line action commands that pass validation are
+        fused; diagnostic commands keep their own channel so their failures
+        can be skipped individually. A run stops growing once the commands
+        would exceed MAX_FUSED_LENGTH. Returns at least 1.
+        """
+        if self._is_local(host):
+            return 1
+
+        end = start
+        fused_size = 0
+        while end < len(commands):
+            cmd = commands[end]
+            cmd_size = self._command_size(cmd)
+            fused_size += cmd_size
+            if (
+                cmd_size > self.MAX_COMMAND_LENGTH
+                or fused_size > self.MAX_FUSED_LENGTH
+                or '\n' in cmd or '\r' in cmd
+                or cmd.rstrip().endswith('\\')
+                or self._is_diagnostic_command(cmd)
+                or not validate_command_safety(cmd, allow_dockerfile_ops)[0]
+            ):
+                break
+            end += 1
+        return max(end - start, 1)
+
+    async def _execute_fused(
+        self,
+        host: HostType,
+        commands: List[str],
+        timeout: Optional[int] = None
+    ) -> Optional[List[Tuple[str, str, int]]]:
+        """
+        Run several action commands over a single SSH channel.
+
+        Each command runs in its own subshell (so cd/exports don't leak into
+        the next one, as with separate channels) through eval of its quoted
+        text, so a parse error (e.g. an unbalanced quote) fails only that
+        command instead of swallowing the rest of the script. Each is
+        followed by a marker carrying its exit code on stdout and a marker
+        on stderr. The script exits at the first failure, matching the
+        batch's stop-on-failure.
+
+        The whole script shares one timeout: the per-command timeout times
+        the number of commands, capped at MAX_FUSED_TIMEOUT.
+
+        If the script times out or errors, commands that already reported a
+        marker keep their real result; the command that was running (with
+        its partial output) and those after it get the error.
+
+        Returns:
+            (stdout, stderr, exit_code) per command that ran, or None if the
+            channel could not be opened (nothing ran; caller falls back to
+            execute_command and its retries)
+        """
+        command_timeout = timeout or settings.command_execution_timeout
+        timeout = min(
+            command_timeout * len(commands),
+            max(command_timeout, self.MAX_FUSED_TIMEOUT)
+        )
+        marker = f"__JARVIS_EXIT_{secrets.token_hex(8)}__"
+        script = "".join(
+            f"( eval {shlex.quote(cmd)}\n)\n"
+            f"__jarvis_rc=$?; printf '\\n{marker} %d\\n' \"$__jarvis_rc\"; printf '\\n{marker}\\n' >&2; "
+            f"[ \"$__jarvis_rc\" -eq 0 ] || exit \"$__jarvis_rc\"\n"
+            for cmd in commands
+        )
+
+        self.logger.info(
+            "executing_fused_commands",
+            host=host.value,
+            commands=commands,
+            timeout=timeout
+        )
+
+        try:
+            conn = await self._checkout(host)
+        except Exception as e:
+            self.logger.warning(
+                "fused_commands_unavailable",
+                host=host.value,
+                error=str(e)
+            )
+            return None
+
+        # Filled as output arrives, so a timeout still has what was read
+        stdout_chunks: List[str] = []
+        stderr_chunks: List[str] = []
+        error = None
+
+        try:
+            async with asyncio.timeout(timeout):
+                fused_stdout, fused_stderr, fused_exit = await self._run_capped(
+                    conn, script, self.MAX_OUTPUT_LENGTH * len(commands),
+                    stdout_chunks, stderr_chunks
+                )
+        except asyncio.TimeoutError:
+            error = f"Command timed out after {timeout} seconds"
+            self.logger.error(
+                "fused_commands_timeout",
+                host=host.value,
+                command_count=len(commands),
+                timeout=timeout
+            )
+        except asyncssh.ChannelOpenError as e:
+            # e.g. a stale cached connection: the script never started
+            self.logger.warning(
+                "fused_commands_unavailable",
+                host=host.value,
+                error=str(e)
+            )
+            return None
+        except Exception as e:
+            error = str(e)
+            self.logger.error(
+                "fused_commands_failed",
+                host=host.value,
+                error=error
+            )
+        finally:
+            self._checkin(host, conn)
+
+        if error is not None:
+            fused_stdout = "".join(stdout_chunks)
+            fused_stderr = "".join(stderr_chunks)
+
+        results, rest_stdout, rest_stderr = self._split_fused_output(
+            marker, fused_stdout, fused_stderr
+        )
+
+        # Nothing after a failed command ran; otherwise the next command is
+        # the one that was running when the script stopped
+        if len(results) < len(commands) and (not results or results[-1][2] == 0):
+            if error is None:
+                # The shell stopped without reporting it (e.g. a syntax error)
+                results.append((rest_stdout, rest_stderr, fused_exit or -1))
+            else:
+                stderr = f"{rest_stderr}\n{error}" if rest_stderr else error
+                results.append((rest_stdout, stderr, -1))
+                results.extend(("", error, -1) for _ in commands[len(results):])
+
+        for cmd, (stdout, stderr, exit_code) in zip(commands, results):
+            self.logger.info(
+                "command_executed",
+                host=host.value,
+                command=cmd,
+                exit_code=exit_code,
+                stdout_length=len(stdout),
+                stderr_length=len(stderr),
+                fused=True
+            )
+
+        self.logger.info(
+            "fused_commands_executed",
+            host=host.value,
+            executed=len(results),
+            total=len(commands),
+            exit_code=results[-1][2]
+        )
+
+        return results
+
+    @staticmethod
+    def _split_fused_output(
+        marker: str,
+        stdout: str,
+        stderr: str
+    ) -> Tuple[List[Tuple[str, str, int]], str, str]:
+        """
+        Split a fused script's output at its exit markers.
+
+        Returns:
+            (stdout, stderr, exit_code) per command that reported a marker,
+            plus the stripped stdout/stderr left after the last marker
+        """
+        stdout_parts = re.split(f"\n{marker} (-?\\d+)\n", stdout)
+        stderr_parts = stderr.split(f"\n{marker}\n")
+
+        results = []
+        for n in range(len(stdout_parts) // 2):
+            part_stderr = stderr_parts[n].strip() if n < len(stderr_parts) else ""
+            results.append((stdout_parts[2 * n].strip(), part_stderr, int(stdout_parts[2 * n + 1])))
+
+        n = len(results)
+        rest_stderr = stderr_parts[n].strip() if n < len(stderr_parts) else ""
+        return results, stdout_parts[-1].strip(), rest_stderr
+
+    def _record_batch_result(
+        self,
+        host: HostType,
+        cmd: str,
+        result: Tuple[str, str, int],
+        outputs: List[str],
+        exit_codes: List[int]
+    ) -> bool:
+        """
+        Append one command's result to a batch's outputs.
+
+        Returns:
+            True if an action command failed (diagnostic failures don't count)
+        """
+        stdout, stderr, exit_code = result
+        output = f"STDOUT:\n{stdout}\n\nSTDERR:\n{stderr}" if stderr else stdout
+        outputs.append(output)
+        exit_codes.append(exit_code)
+
+        if exit_code == 0:
+            return False
+
+        if self._is_diagnostic_command(cmd):
+            # HIGH-002 FIX: Continue on diagnostic command failure
+            self.logger.info(
+                "diagnostic_command_failed_continuing",
+                host=host.value,
+                command=cmd,
+                exit_code=exit_code
+            )
+            # Don't mark as overall failure for diagnostic commands
+            return False
+
+        self.logger.warning(
+            "command_failed_in_batch",
+            host=host.value,
+            command=cmd,
+            exit_code=exit_code
+        )
+        return True
+
+    async def _execute_parallel(
+        self,
+        host: HostType,
+        commands: List[str],
+        timeout: Optional[int],
+        allow_dockerfile_ops: bool
+    ) -> List[Tuple[str, str, int]]:
+        """
+        Run independent commands concurrently, one channel each.
+
+        At most MAX_SESSIONS_PER_CONNECTION run at once, so a batch fits on a
+        single pooled connection; batch wall time is roughly the slowest
+        command rather than the sum.
+        """
+        sessions = asyncio.Semaphore(self.MAX_SESSIONS_PER_CONNECTION)
+
+        async def run_one(cmd: str) -> Tuple[str, str, int]:
+            async with sessions:
+                return await self.execute_command(
+                    host, cmd, timeout, allow_dockerfile_ops=allow_dockerfile_ops
+                )
+
+        return await asyncio.gather(*(run_one(cmd) for cmd in commands))
+
     async def execute_commands(
         self,
         host: HostType,
         commands: List[str],
         timeout: Optional[int] = None,
-        allow_dockerfile_ops: bool = False
+        allow_dockerfile_ops: bool = False,
+        parallel: bool = False
     ) -> SSHExecutionResult:
         """
         Execute a sequence of commands on a remote host.
@@ -616,11 +1313,14 @@ class SSHExecutor:
             commands: List of commands to execute
             timeout: Total execution timeout
             allow_dockerfile_ops: If True, allow safe Dockerfile modification patterns
+            parallel: Commands are independent (e.g. read-only checks): run them
+                concurrently on channels of the pooled connection instead of
+                one after another. Every command runs even if one fails.
 
         Returns:
             SSHExecutionResult with execution details
         """
-        start_time = datetime.utcnow()
+        t0 = time.monotonic()
         outputs = []
         exit_codes = []
         overall_success = True
@@ -631,54 +1331,57 @@ class SSHExecutor:
             command_count=len(commands)
         )
 
-        for cmd in commands:
+        failed_exit_code = None
+
+        if parallel:
+            # Independent commands: all run; the batch fails on the first
+            # failed action command in list order
+            results = await self._execute_parallel(host, commands, timeout, allow_dockerfile_ops)
+            for cmd, result in zip(commands, results):
+                if self._record_batch_result(host, cmd, result, outputs, exit_codes) and overall_success:
+                    overall_success = False
+                    failed_exit_code = result[2]
+
+        i = 0
+        stop = parallel
+        while i < len(commands) and not stop:
+            cmd = commands[i]
             # MEDIUM-003 FIX: Validate command length
-            if len(cmd) > self.MAX_COMMAND_LENGTH:
+            cmd_size = self._command_size(cmd)
+            if cmd_size > self.MAX_COMMAND_LENGTH:
                 self.logger.error(
                     "command_too_long",
                     host=host.value,
-                    command_length=len(cmd),
+                    command_length=cmd_size,
                     max_length=self.MAX_COMMAND_LENGTH,
                     command_preview=cmd[:100] + "..."
                 )
-                outputs.append(f"Error: Command exceeds maximum length of {self.MAX_COMMAND_LENGTH} characters")
+                outputs.append(f"Error: Command exceeds maximum length of {self.MAX_COMMAND_LENGTH} bytes")
                 exit_codes.append(-1)
                 overall_success = False
+                failed_exit_code = -1
                 break
-            stdout, stderr, exit_code = await self.execute_command(
-                host, cmd, timeout, allow_dockerfile_ops=allow_dockerfile_ops
-            )
-
-            output = f"STDOUT:\n{stdout}\n\nSTDERR:\n{stderr}" if stderr else stdout
-            outputs.append(output)
-            exit_codes.append(exit_code)
-
-            if exit_code != 0:
-                is_diagnostic = self._is_diagnostic_command(cmd)
 
-                if is_diagnostic:
-                    # HIGH-002 FIX: Continue on diagnostic command failure
-                    self.logger.info(
-                        "diagnostic_command_failed_continuing",
-                        host=host.value,
-                        command=cmd,
-                        exit_code=exit_code
-                    )
-                    # Don't mark as overall failure for diagnostic commands
-                    continue
-                else:
+            # Consecutive action commands share one SSH channel
+            results = None
+            run_length = self._fusable_run_length(host, commands, i, allow_dockerfile_ops)
+            if run_length > 1:
+                results = await self._execute_fused(host, commands[i:i + run_length], timeout)
+            if not results:
+                results = [await self.execute_command(
+                    host, cmd, timeout, allow_dockerfile_ops=allow_dockerfile_ops
+                )]
+
+            for cmd, result in zip(commands[i:], results):
+                i += 1
+                if self._record_batch_result(host, cmd, result, outputs, exit_codes):
                     overall_success = False
-                    self.logger.warning(
-                        "command_failed_in_batch",
-                        host=host.value,
-                        command=cmd,
-                        exit_code=exit_code
-                    )
+                    failed_exit_code = result[2]
                     # Stop execution on action command failure
+                    stop = True
                     break
 
-        end_time = datetime.utcnow()
-        duration = int((end_time - start_time).total_seconds())
+        duration = int(time.monotonic() - t0)
 
         result = SSHExecutionResult(
             success=overall_success,
@@ -686,7 +1389,7 @@ class SSHExecutor:
             outputs=outputs,
             exit_codes=exit_codes,
             duration_seconds=duration,
-            error=None if overall_success else f"Command failed with exit code {exit_codes[-1]}"
+            error=None if overall_success else f"Command failed with exit code {failed_exit_code}"
         )
 
         self.logger.info(
@@ -737,7 +1440,10 @@ class SSHExecutor:
             lines=lines
         )
 
-        stdout, stderr, exit_code = await self.execute_command(host, command)
+        # Reading logs is safe to repeat, so a slow host gets another try
+        stdout, stderr, exit_code = await self.execute_command(
+            host, command, retry_on_timeout=True
+        )
 
         if exit_code != 0:
             self.logger.warning(
@@ -781,14 +1487,20 @@ class SSHExecutor:
         Close all open SSH connections.
         Should be called on shutdown.
         """
-        for host, conn in list(self._connections.items()):
-            if not conn.is_closed():
-                conn.close()
-                self.logger.info(
-                    "ssh_connection_closed",
-                    host=host.value
-                )
+        if self._idle_reaper is not None:
+            self._idle_reaper.cancel()
+            self._idle_reaper = None
+
+        for host, pool in self._connections.items():
+            for conn in pool:
+                if not conn.is_closed():
+                    conn.close()
+                    self.logger.info(
+                        "ssh_connection_closed",
+                        host=host.value
+                    )
         self._connections.clear()
+        self._last_used.clear()
 
 
 # Global SSH executor instance
@@ -2,13 +2,91 @@
 Utility functions and helpers.
 """
 
+import ahocorasick
+import functools
+import re
 import structlog
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
+from . import metrics
 from .models import HostType, Alert
 
 
 logger = structlog.get_logger()
 
+# Container name in descriptions like "container X is down" (lowercased text)
+CONTAINER_IN_DESCRIPTION_RE = re.compile(r'container\s+([a-z0-9_-]+)\s+is')
+
+# Explicit target_host hint values (exact match, e.g. from remediation_host)
+TARGET_HOST_HINTS: Mapping[str, HostType] = MappingProxyType({
+    "management-host": HostType.SKYNET,
+    "service-host": HostType.NEXUS,
+    "vps-host": HostType.OUTPOST,
+    "vps": HostType.OUTPOST,
+    "ha-host": HostType.HOMEASSISTANT,
+    "ha": HostType.HOMEASSISTANT,
+})
+
+# Host indicators in the instance label (hostname-based, not IP-based for
+# portability), in priority order: the first rule with a hit wins
+INSTANCE_HOST_RULES: Tuple[Tuple[Tuple[str, ...], HostType], ...] = (
+    (("vps-host", "vps"), HostType.OUTPOST),
+    (("ha-host", "ha"), HostType.HOMEASSISTANT),
+    (("management-host",), HostType.SKYNET),
+    (("service-host",), HostType.NEXUS),
+)
+
+# Common service patterns in the alert name, in priority order
+ALERT_NAME_HOST_RULES: Tuple[Tuple[Tuple[str, ...], HostType], ...] = (
+    (("wireguard", "vpn"), HostType.OUTPOST),
+    (("frigate", "adguard", "caddy"), HostType.NEXUS),
+    (("zigbee", "automation"), HostType.HOMEASSISTANT),
+)
+
+
+# Common Docker containers in the homelab (set: exact-name membership)
+DOCKER_SERVICES = frozenset({
+    "caddy", "frigate", "adguard", "vaultwarden", "prometheus",
+    "grafana", "loki", "alertmanager", "n8n", "n8n-db",
+    "actual-budget", "rustdesk", "blackbox-exporter"
+})
+
+# Common systemd services (matched as substrings of the service name)
+SYSTEMD_SERVICES = (
+    "wg-quick", "wireguard", "ssh", "docker", "postgresql",
+    "home-assistant", "zigbee2mqtt"
+)
+
+# Keywords of alerts that typically span systems (VPN/network)
+CROSS_SYSTEM_KEYWORDS = (
+    "wireguard", "vpn", "tunnel", "site-to-site",
+    "connectivity", "unreachable", "network"
+)
+
+
+def _build_host_automaton(rules: Tuple[Tuple[Tuple[str, ...], HostType], ...]) -> ahocorasick.Automaton:
+    """Aho-Corasick automaton mapping each keyword to its rule's priority."""
+    automaton = ahocorasick.Automaton()
+    for priority, (keywords, _host) in enumerate(rules):
+        for keyword in keywords:
+            automaton.add_word(keyword, priority)
+    automaton.make_automaton()
+    return automaton
+
+
+INSTANCE_HOST_AUTOMATON = _build_host_automaton(INSTANCE_HOST_RULES)
+ALERT_NAME_HOST_AUTOMATON = _build_host_automaton(ALERT_NAME_HOST_RULES)
+
+
+def _match_host(
+    automaton: ahocorasick.Automaton,
+    rules: Tuple[Tuple[Tuple[str, ...], HostType], ...],
+    text: str
+) -> Optional[HostType]:
+    """Host of the highest-priority rule with a keyword in text (one scan)."""
+    priority = min((hit for _end, hit in automaton.iter(text)), default=None)
+    return None if priority is None else rules[priority][1]
+
 
 def determine_target_host(alert: Alert, hints: Optional[Dict[str, Any]] = None) -> HostType:
     """
@@ -26,37 +104,23 @@ def determine_target_host(alert: Alert, hints: Optional[Dict[str, Any]] = None)
     """
     # v3.0: Check for explicit host hint first (highest priority)
     if hints and hints.get("target_host"):
-        hint_host = hints["target_host"].lower()
-        if hint_host == "management-host":
-            return HostType.SKYNET
-        elif hint_host == "service-host":
-            return HostType.NEXUS
-        elif hint_host in ("vps-host", "vps"):
-            return HostType.OUTPOST
-        elif hint_host in ("ha-host", "ha"):
-            return HostType.HOMEASSISTANT
+        hint_host = TARGET_HOST_HINTS.get(hints["target_host"].lower())
+        if hint_host is not None:
+            return hint_host
 
     instance = alert.labels.instance.lower()
 
-    # Check for explicit host indicators (hostname-based, not IP-based for portability)
-    if "vps-host" in instance or "vps" in instance:
-        return HostType.OUTPOST
-    elif "ha-host" in instance or "ha" in instance:
-        return HostType.HOMEASSISTANT
-    elif "management-host" in instance:
-        return HostType.SKYNET
-    elif "service-host" in instance:
-        return HostType.NEXUS
+    # Check for explicit host indicators (see INSTANCE_HOST_RULES)
+    host = _match_host(INSTANCE_HOST_AUTOMATON, INSTANCE_HOST_RULES, instance)
+    if host is not None:
+        return host
 
     # Default based on common service patterns
     alert_name = alert.labels.alertname.lower()
 
-    if "wireguard" in alert_name or "vpn" in alert_name:
-        return HostType.OUTPOST
-    elif "frigate" in alert_name or "adguard" in alert_name or "caddy" in alert_name:
-        return HostType.NEXUS
-    elif "zigbee" in alert_name or "automation" in alert_name:
-        return HostType.HOMEASSISTANT
+    host = _match_host(ALERT_NAME_HOST_AUTOMATON, ALERT_NAME_HOST_RULES, alert_name)
+    if host is not None:
+        return host
 
     # Default to Service-Host (most services run there)
     logger.warning(
@@ -106,8 +170,7 @@ def extract_service_name(alert: Alert) -> Optional[str]:
         if hasattr(alert.annotations, "description"):
             desc = alert.annotations.description.lower()
             # Look for patterns like "container X is down"
-            import re
-            match = re.search(r'container\s+([a-z0-9_-]+)\s+is', desc)
+            match = CONTAINER_IN_DESCRIPTION_RE.search(desc)
             if match:
                 return match.group(1)
 
@@ -135,25 +198,16 @@ def determine_service_type(alert: Alert, service_name: Optional[str]) -> str:
     elif "system" in alert_name or "node" in alert_name:
         return "system"
 
-    # Common Docker containers in the homelab
-    docker_services = [
-        "caddy", "frigate", "adguard", "vaultwarden", "prometheus",
-        "grafana", "loki", "alertmanager", "n8n", "n8n-db",
-        "actual-budget", "rustdesk", "blackbox-exporter"
-    ]
-
-    if service_name and service_name.lower() in docker_services:
-        return "docker"
+    if service_name:
+        service_lower = service_name.lower()
 
-    # Common systemd services
-    systemd_services = [
-        "wg-quick", "wireguard", "ssh", "docker", "postgresql",
-        "home-assistant", "zigbee2mqtt"
-    ]
+        # Common Docker containers in the homelab (exact name)
+        if service_lower in DOCKER_SERVICES:
+            return "docker"
 
-    if service_name:
-        for svc in systemd_services:
-            if svc in service_name.lower():
+        # Common systemd services (substring of the name)
+        for svc in SYSTEMD_SERVICES:
+            if svc in service_lower:
                 return "systemd"
 
     # Default to docker (most services are containerized)
@@ -224,12 +278,7 @@ def is_cross_system_alert(alert: Alert) -> bool:
         description = alert.annotations.description.lower()
 
     # VPN/network alerts typically span systems
-    cross_system_keywords = [
-        "wireguard", "vpn", "tunnel", "site-to-site",
-        "connectivity", "unreachable", "network"
-    ]
-
-    for keyword in cross_system_keywords:
+    for keyword in CROSS_SYSTEM_KEYWORDS:
         if keyword in alert_name or keyword in description:
             return True
 
@@ -348,104 +397,128 @@ def extract_hints_from_alert(alert: Alert) -> Dict[str, Any]:
     v3.8.1-fix: Fixed Pydantic v2 extra field access via model_extra.
     MEDIUM-010 FIX: Now sanitizes Unicode characters in hint values.
 
+    Results are cached by the raw label/annotation values they depend on,
+    since retried and repeated alerts carry the same values.
+
     Args:
         alert: Alert instance
 
     Returns:
-        Dictionary of hints
+        Dictionary of hints (a fresh dict the caller may modify)
     """
-    hints = {}
-
     # Check for remediation hints in labels (using helper for extra fields)
     labels = alert.labels
+    annotations = alert.annotations
+    alert_name = labels.alertname.lower()
+    system = _get_extra_field(labels, "system")
+
+    # Log at info level for visibility during debugging
+    if alert_name == "backupstale":
+        logger.info(
+            "backup_stale_label_extraction",
+            alert_name=alert_name,
+            system_label=_sanitize_hint_value(system),
+            has_model_extra=bool(getattr(labels, "model_extra", None)),
+            model_extra_keys=list(getattr(labels, "model_extra", {}).keys()) if getattr(labels, "model_extra", None) else []
+        )
+
+    hits_before = _extract_hints_cached.cache_info().hits
+    hints = dict(_extract_hints_cached(
+        alert_name,
+        _get_extra_field(labels, "remediation_hint"),
+        _get_extra_field(labels, "remediation_host"),
+        _get_extra_field(labels, "service"),
+        _get_extra_field(labels, "container"),
+        _get_extra_field(labels, "job"),
+        _get_extra_field(annotations, "runbook_url"),
+        _get_extra_field(annotations, "remediation"),
+        system
+    ))
+    metrics.record_hint_cache_lookup(_extract_hints_cached.cache_info().hits > hits_before)
+
+    if "system_specific_command" in hints:
+        logger.info(
+            "backup_stale_system_hint_applied",
+            system=hints["system"],
+            target_host=hints["target_host"],
+            command=hints["system_specific_command"]
+        )
+
+    return hints
+
 
-    # Standard hint extraction using Pydantic v2-compatible helper
-    remediation_hint = _get_extra_field(labels, "remediation_hint")
+# v3.8.1: Backup notify script and host per system label for BackupStale alerts
+BACKUP_REMEDIATION_MAP = {
+    "ha-host": {
+        "target_host": "management-host",
+        "remediation_commands": "/home/<user>/homelab/scripts/backup/backup_ha-host_notify.sh"
+    },
+    "management-host": {
+        "target_host": "management-host",
+        "remediation_commands": "/home/<user>/homelab/scripts/backup/backup_management-host_notify.sh"
+    },
+    "service-host": {
+        "target_host": "service-host",
+        "remediation_commands": "/home/<user>/docker/backups/backup_notify.sh"
+    },
+    "vps-host": {
+        "target_host": "vps-host",
+        "remediation_commands": "/opt/<app>/backups/backup_vps_notify.sh"
+    }
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_hints_cached(
+    alert_name: str,
+    remediation_hint: str,
+    remediation_host: str,
+    service: str,
+    container: str,
+    job: str,
+    runbook_url: str,
+    remediation: str,
+    system: str
+) -> Tuple[Tuple[str, str], ...]:
+    """
+    Build hints from raw field values (lowercased alert name).
+
+    Returns an immutable tuple of (key, value) pairs so cached results can
+    be shared safely; extract_hints_from_alert turns it into a dict.
+    """
+    hints = {}
+
+    # Standard hint extraction from labels
     if remediation_hint:
         hints["remediation_hint"] = _sanitize_hint_value(remediation_hint)
-
-    remediation_host = _get_extra_field(labels, "remediation_host")
     if remediation_host:
         hints["target_host"] = _sanitize_hint_value(remediation_host)
-
-    service = _get_extra_field(labels, "service")
     if service:
         hints["service"] = _sanitize_hint_value(service)
-
-    container = _get_extra_field(labels, "container")
     if container:
         hints["container"] = _sanitize_hint_value(container)
-
-    job = _get_extra_field(labels, "job")
     if job:
         hints["job"] = _sanitize_hint_value(job)
 
-    # Check for hints in annotations
-    annotations = alert.annotations
-
-    runbook_url = _get_extra_field(annotations, "runbook_url")
+    # Hints in annotations
     if runbook_url:
         hints["runbook_url"] = _sanitize_hint_value(runbook_url)
-
-    remediation = _get_extra_field(annotations, "remediation")
     if remediation:
         hints["suggested_remediation"] = _sanitize_hint_value(remediation)
 
     # v3.8.1: System-aware remediation for multi-system alerts like BackupStale
     # The 'system' label tells us which backup is stale and overrides static hints
-    alert_name = labels.alertname.lower()
-    system_label = _sanitize_hint_value(_get_extra_field(labels, "system"))
-
-    # Log at info level for visibility during debugging
-    if alert_name == "backupstale":
-        logger.info(
-            "backup_stale_label_extraction",
-            alert_name=alert_name,
-            system_label=system_label,
-            has_model_extra=bool(getattr(labels, "model_extra", None)),
-            model_extra_keys=list(getattr(labels, "model_extra", {}).keys()) if getattr(labels, "model_extra", None) else []
-        )
-
+    system_label = _sanitize_hint_value(system)
     if alert_name == "backupstale" and system_label:
-        # Override target_host and remediation_commands based on system label
-        backup_remediation_map = {
-            "ha-host": {
-                "target_host": "management-host",
-                "remediation_commands": "/home/<user>/homelab/scripts/backup/backup_ha-host_notify.sh"
-            },
-            "management-host": {
-                "target_host": "management-host",
-                "remediation_commands": "/home/<user>/homelab/scripts/backup/backup_management-host_notify.sh"
-            },
-            "service-host": {
-                "target_host": "service-host",
-                "remediation_commands": "/home/<user>/docker/backups/backup_notify.sh"
-            },
-            "vps-host": {
-                "target_host": "vps-host",
-                "remediation_commands": "/opt/<app>/backups/backup_vps_notify.sh"
-            }
-        }
-
-        system_lower = system_label.lower()
-        if system_lower in backup_remediation_map:
-            remediation_info = backup_remediation_map[system_lower]
+        remediation_info = BACKUP_REMEDIATION_MAP.get(system_label.lower())
+        if remediation_info:
             # Override the target_host from the system label (more specific than alert rule)
             hints["target_host"] = remediation_info["target_host"]
             hints["system_specific_command"] = remediation_info["remediation_commands"]
             hints["system"] = system_label
 
-            logger.info(
-                "backup_stale_system_hint_applied",
-                system=system_label,
-                target_host=hints["target_host"],
-                command=hints["system_specific_command"]
-            )
-
     # MEDIUM-010 FIX: Remove empty string values
-    hints = {k: v for k, v in hints.items() if v}
-
-    return hints
+    return tuple((k, v) for k, v in hints.items() if v)
 
 
 def get_confidence_level(confidence_score: float) -> str:
@@ -474,7 +474,7 @@ CREATE TABLE IF NOT EXISTS state_snapshots (
     host VARCHAR(50) NOT NULL,                -- 'service-host', 'ha-host', 'vps-host', 'management-host'
     target_type VARCHAR(20) NOT NULL,         -- 'container', 'service', 'config', 'database'
     target_name VARCHAR(255) NOT NULL,        -- Container name, service name, etc.
-    state_data TEXT,                          -- JSON blob of captured state
+    state_data JSONB,                         -- Captured state (inspect, logs, status, etc.)
     alert_context TEXT,                       -- Alert that triggered snapshot
     rolled_back_at TIMESTAMP,                 -- When rollback was performed (NULL if not rolled back)
     rollback_reason TEXT,                     -- Why rollback was performed
@@ -485,6 +485,10 @@ CREATE INDEX IF NOT EXISTS idx_snapshots_id ON state_snapshots(snapshot_id);
 CREATE INDEX IF NOT EXISTS idx_snapshots_host ON state_snapshots(host);
 CREATE INDEX IF NOT EXISTS idx_snapshots_target ON state_snapshots(target_type, target_name);
 CREATE INDEX IF NOT EXISTS idx_snapshots_time ON state_snapshots(created_at DESC);
+-- Covering index for list_recent_snapshots (index-only scan, no heap fetch)
+CREATE INDEX IF NOT EXISTS idx_snapshots_recent_covering
+    ON state_snapshots(created_at DESC, target_type)
+    INCLUDE (snapshot_id, host, target_name, alert_context, rolled_back_at);
 
 
 -- ============================================================================
@@ -524,7 +528,7 @@ CREATE TABLE IF NOT EXISTS self_preservation_handoffs (
     handoff_id VARCHAR(64) NOT NULL UNIQUE,
     restart_target VARCHAR(50) NOT NULL,          -- 'jarvis', 'postgres-jarvis', 'docker-daemon', 'management-host-host'
     restart_reason TEXT NOT NULL,
-    remediation_context TEXT,                     -- JSON blob of serialized RemediationContext
+    remediation_context JSONB,                    -- Serialized RemediationContext
     status VARCHAR(20) NOT NULL DEFAULT 'pending', -- 'pending', 'in_progress', 'completed', 'failed', 'timeout', 'cancelled'
     callback_url VARCHAR(500) NOT NULL,
     n8n_execution_id VARCHAR(100),
@@ -539,8 +543,8 @@ CREATE INDEX IF NOT EXISTS idx_sp_created ON self_preservation_handoffs(created_
 
 -- Only allow one pending or in-progress handoff at a time
 -- This prevents multiple concurrent self-restarts
-CREATE UNIQUE INDEX IF NOT EXISTS idx_sp_active_handoff
-    ON self_preservation_handoffs(status)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_sp_one_active_handoff
+    ON self_preservation_handoffs ((true))
     WHERE status IN ('pending', 'in_progress');
 
 
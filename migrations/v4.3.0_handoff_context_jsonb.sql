@@ -0,0 +1,24 @@
+-- Migration: v4.3.0 - Store handoff remediation context as JSONB
+-- Purpose: self_preservation_handoffs.remediation_context was a TEXT blob of
+--          serialized RemediationContext JSON. As JSONB it is validated and
+--          stored in Postgres' binary JSON format, and is written through the
+--          asyncpg JSONB codec.
+-- Run this migration on existing databases before upgrading.
+
+ALTER TABLE self_preservation_handoffs
+ALTER COLUMN remediation_context TYPE JSONB USING remediation_context::jsonb;
+
+-- Verify the column type
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'self_preservation_handoffs'
+          AND column_name = 'remediation_context'
+          AND data_type = 'jsonb'
+    ) THEN
+        RAISE NOTICE 'Migration v4.3.0: self_preservation_handoffs.remediation_context is now JSONB';
+    ELSE
+        RAISE EXCEPTION 'Migration v4.3.0: Failed to convert self_preservation_handoffs.remediation_context to JSONB';
+    END IF;
+END $$;
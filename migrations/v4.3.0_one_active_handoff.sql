@@ -0,0 +1,30 @@
+-- Migration: v4.3.0 - Enforce a single active self-preservation handoff
+-- Purpose: idx_sp_active_handoff was unique on (status), which still allowed
+--          one 'pending' AND one 'in_progress' handoff at the same time, so
+--          initiate_self_restart serialized itself with an advisory lock and
+--          a check-then-insert transaction. A unique index on a constant
+--          over the active rows lets the INSERT itself reject a second active
+--          handoff, with no lock traffic.
+-- Run this migration on existing databases before upgrading. It fails if
+-- both a pending and an in_progress handoff exist; resolve those first.
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_sp_one_active_handoff
+    ON self_preservation_handoffs ((true))
+    WHERE status IN ('pending', 'in_progress');
+
+-- Superseded by idx_sp_one_active_handoff
+DROP INDEX IF EXISTS idx_sp_active_handoff;
+
+-- Verify the index exists
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_indexes
+        WHERE tablename = 'self_preservation_handoffs'
+          AND indexname = 'idx_sp_one_active_handoff'
+    ) THEN
+        RAISE NOTICE 'Migration v4.3.0: idx_sp_one_active_handoff created';
+    ELSE
+        RAISE EXCEPTION 'Migration v4.3.0: Failed to create idx_sp_one_active_handoff';
+    END IF;
+END $$;
@@ -0,0 +1,24 @@
+-- Migration: v4.3.0 - Store state snapshot data as JSONB
+-- Purpose: state_snapshots.state_data was a TEXT blob that the application
+--          json.dumps()'d on write and json.loads()'d on read. As JSONB the
+--          asyncpg codec handles (de)serialization and rows are stored in
+--          Postgres' binary JSON format.
+-- Run this migration on existing databases before upgrading.
+
+ALTER TABLE state_snapshots
+ALTER COLUMN state_data TYPE JSONB USING state_data::jsonb;
+
+-- Verify the column type
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'state_snapshots'
+          AND column_name = 'state_data'
+          AND data_type = 'jsonb'
+    ) THEN
+        RAISE NOTICE 'Migration v4.3.0: state_snapshots.state_data is now JSONB';
+    ELSE
+        RAISE EXCEPTION 'Migration v4.3.0: Failed to convert state_snapshots.state_data to JSONB';
+    END IF;
+END $$;
@@ -0,0 +1,20 @@
+-- Migration: v4.3.0 - Covering index for recent snapshot listing
+-- Purpose: list_recent_snapshots filters on created_at (and optionally
+--          target_type), orders by created_at DESC and only reads summary
+--          columns. INCLUDE-ing those columns lets Postgres answer it with
+--          an index-only scan instead of fetching each heap row.
+-- Run this migration on existing databases before upgrading.
+
+CREATE INDEX IF NOT EXISTS idx_snapshots_recent_covering
+    ON state_snapshots(created_at DESC, target_type)
+    INCLUDE (snapshot_id, host, target_name, alert_context, rolled_back_at);
+
+-- Verify the index was created
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_indexes WHERE indexname = 'idx_snapshots_recent_covering') THEN
+        RAISE NOTICE 'Migration v4.3.0: idx_snapshots_recent_covering created successfully';
+    ELSE
+        RAISE EXCEPTION 'Migration v4.3.0: Failed to create idx_snapshots_recent_covering';
+    END IF;
+END $$;
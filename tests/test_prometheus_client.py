@@ -0,0 +1,80 @@
+"""
+Tests for remediation verification against Prometheus.
+"""
+
+import pytest
+
+from app import prometheus_client
+from app.prometheus_client import PrometheusClient
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock advanced by asyncio.sleep instead of waiting."""
+    now = [1000.0]
+
+    async def sleep(seconds):
+        now[0] += seconds
+
+    monkeypatch.setattr(prometheus_client.asyncio, "sleep", sleep)
+    monkeypatch.setattr(prometheus_client.time, "monotonic", lambda: now[0])
+    return now
+
+
+def client_with_statuses(statuses):
+    """PrometheusClient whose get_alert_status answers from statuses in order."""
+    client = PrometheusClient(base_url="http://prometheus.test")
+    answers = iter(statuses)
+    calls = []
+
+    async def get_alert_status(alert_name, instance=None, labels=None):
+        calls.append(alert_name)
+        return next(answers)
+
+    client.get_alert_status = get_alert_status
+    return client, calls
+
+
+@pytest.mark.asyncio
+async def test_stale_polls_do_not_use_up_checks(clock):
+    # 2 checks in 50s; stale answers in between must not count against them
+    client, calls = client_with_statuses(
+        ["unknown_stale", "firing", "unknown_stale", "resolved"]
+    )
+
+    verified, message = await client.verify_remediation(
+        "ContainerDown", max_wait_seconds=50, poll_interval=10, initial_delay=10
+    )
+
+    assert verified is True
+    assert len(calls) == 4
+    assert message == "Alert resolved after 40s"
+
+
+@pytest.mark.asyncio
+async def test_only_fresh_checks_count_toward_failure(clock):
+    # Stale polls take their time within max_wait but don't decide the result
+    client, calls = client_with_statuses(["firing", "unknown_stale", "firing", "firing"])
+
+    verified, message = await client.verify_remediation(
+        "ContainerDown", max_wait_seconds=50, poll_interval=10, initial_delay=10
+    )
+
+    assert verified is False
+    assert len(calls) == 4
+    assert message == "Alert still firing after 50s"
+
+
+@pytest.mark.asyncio
+async def test_stale_polls_do_not_extend_max_wait(clock):
+    started = clock[0]
+    client, calls = client_with_statuses(["unknown_stale"] * 100)
+
+    verified, message = await client.verify_remediation(
+        "ContainerDown", max_wait_seconds=30, poll_interval=10, initial_delay=10
+    )
+
+    assert verified is False
+    assert len(calls) == 2
+    assert clock[0] - started <= 30
+    assert "stale" in message
@@ -0,0 +1,57 @@
+"""
+Tests for runbook markdown parsing.
+"""
+
+from app.runbook_manager import RunbookManager
+
+
+RUNBOOK = """---
+risk_level: high
+estimated_duration: 2 minutes
+---
+# Container Down Runbook
+
+## Overview
+A container has stopped.
+
+## Investigation
+1. Check container status
+2. Read the logs
+
+## Remediation
+- Restart the container
+
+```bash
+docker restart app
+```
+"""
+
+
+def parse(content: str):
+    return RunbookManager(runbook_dir="/nonexistent")._parse_content(
+        "ContainerDown", content.encode()
+    )
+
+
+def test_parse_lf_runbook():
+    runbook = parse(RUNBOOK)
+
+    assert runbook.title == "Container Down Runbook"
+    assert runbook.overview == "A container has stopped."
+    assert runbook.investigation_steps == ("Check container status", "Read the logs")
+    assert runbook.remediation_steps == ("Restart the container",)
+    assert runbook.commands == ("docker restart app",)
+    assert runbook.risk_level == "high"
+    assert runbook.estimated_duration == "2 minutes"
+
+
+def test_parse_crlf_runbook_matches_lf():
+    assert parse(RUNBOOK.replace("\n", "\r\n")) == parse(RUNBOOK)
+
+
+def test_parse_crlf_title_and_frontmatter():
+    runbook = parse(RUNBOOK.replace("\n", "\r\n"))
+
+    assert runbook.title == "Container Down Runbook"
+    assert runbook.risk_level == "high"
+    assert runbook.estimated_duration == "2 minutes"
@@ -0,0 +1,119 @@
+"""
+Tests for SSH command execution helpers.
+
+Fused scripts are run by a local /bin/sh standing in for the remote shell.
+"""
+
+import asyncio
+
+import pytest
+
+from app.models import HostType
+from app.ssh_executor import SSHExecutor, _is_safe_pipe_command
+
+
+class _Reader:
+    def __init__(self, stream):
+        self._stream = stream
+
+    async def read(self, n):
+        return (await self._stream.read(n)).decode()
+
+
+class _LocalProcess:
+    """Minimal stand-in for an asyncssh process, backed by sh -c."""
+
+    def __init__(self, command):
+        self._command = command
+        self.exit_status = None
+
+    async def __aenter__(self):
+        self._proc = await asyncio.create_subprocess_exec(
+            "sh", "-c", self._command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        self.stdout = _Reader(self._proc.stdout)
+        self.stderr = _Reader(self._proc.stderr)
+        return self
+
+    async def __aexit__(self, *exc):
+        if self._proc.returncode is None:
+            self._proc.kill()
+            await self._proc.wait()
+
+    async def wait(self):
+        self.exit_status = await self._proc.wait()
+
+
+class _LocalConnection:
+    def create_process(self, command):
+        return _LocalProcess(command)
+
+
+@pytest.fixture
+def executor():
+    executor = SSHExecutor()
+
+    async def checkout(host):
+        return _LocalConnection()
+
+    executor._checkout = checkout
+    executor._checkin = lambda host, conn: None
+    return executor
+
+
+@pytest.mark.asyncio
+async def test_fused_results_per_command(executor, tmp_path):
+    results = await executor._execute_fused(
+        HostType.NEXUS,
+        [f"cd {tmp_path}", "pwd", "echo err >&2 && echo out"],
+        timeout=5
+    )
+
+    # cd runs in its own subshell, like a separate channel
+    assert [r[2] for r in results] == [0, 0, 0]
+    assert results[1][0] != str(tmp_path)
+    assert results[2][:2] == ("out", "err")
+
+
+@pytest.mark.asyncio
+async def test_fused_unbalanced_quote_fails_only_that_command(executor, tmp_path):
+    one, two = tmp_path / "one", tmp_path / "two"
+
+    results = await executor._execute_fused(
+        HostType.NEXUS,
+        # Pasted raw, the first quote would pair with the third command's
+        [f'touch {one} "oops', f"touch {two}", 'echo "x'],
+        timeout=5
+    )
+
+    # Same outcome as running the command on its own channel: a syntax
+    # error that runs nothing, and the batch stops there
+    assert len(results) == 1
+    assert results[0][2] != 0
+    assert not one.exists()
+    assert not two.exists()
+
+
+@pytest.mark.asyncio
+async def test_fused_timeout_keeps_completed_results(executor):
+    executor.MAX_FUSED_TIMEOUT = 1
+
+    results = await executor._execute_fused(
+        HostType.NEXUS,
+        ["echo first", "echo partial; sleep 5", "echo never"],
+        timeout=1
+    )
+
+    assert results[0] == ("first", "", 0)
+    assert results[1][0] == "partial"
+    assert "timed out" in results[1][1]
+    assert results[2] == ("", results[2][1], -1)
+    assert "timed out" in results[2][1]
+
+
+def test_pipe_segments_are_matched_trimmed():
+    assert _is_safe_pipe_command("docker logs app \t|  grep error ")
+    assert _is_safe_pipe_command("docker logs app" + " " * 10000 + "| grep error")
+    assert not _is_safe_pipe_command("docker logs app |" + " " * 10000 + "sh")